@@ -1,5 +1,10 @@
 """dmxld - DMX lighting control library."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from dmxld.model import (
     Vec3,
     FixtureState,
@@ -12,32 +17,65 @@ from dmxld.blend import (
     BlendOp,
     FixtureDelta,
     apply_delta,
+    apply_delta_inplace,
+    apply_deltas_inplace,
     merge_deltas,
     scale_deltas,
     scale_deltas_into,
     compose_add,
     compose_override,
 )
-from dmxld.clips import Clip, Scene, EffectClip, fade
-from dmxld.engine import DMXEngine, Protocol
-
-# Attributes
-from dmxld.attributes import (
-    DimmerAttr,
-    RGBAttr,
-    RGBWAttr,
-    RGBAAttr,
-    RGBAWAttr,
-    StrobeAttr,
-    PanAttr,
-    TiltAttr,
-    GoboAttr,
-    SkipAttr,
-)
+from dmxld.clips import Clip, Scene, EffectClip, fade, fade_batch
 
 # Color
 from dmxld.color import Color, Raw, rgb, set_color_strategy
 
+if TYPE_CHECKING:
+    from dmxld.engine import DMXEngine, Protocol
+    from dmxld.attributes import (
+        DimmerAttr,
+        RGBAttr,
+        RGBWAttr,
+        RGBAAttr,
+        RGBAWAttr,
+        StrobeAttr,
+        PanAttr,
+        TiltAttr,
+        GoboAttr,
+        SkipAttr,
+    )
+
+# Loaded on first access (PEP 562) so importing dmxld for modelling or blending
+# doesn't pull in the engine or every attribute class.
+_LAZY: dict[str, str] = {
+    "DMXEngine": "dmxld.engine",
+    "Protocol": "dmxld.engine",
+    "DimmerAttr": "dmxld.attributes",
+    "RGBAttr": "dmxld.attributes",
+    "RGBWAttr": "dmxld.attributes",
+    "RGBAAttr": "dmxld.attributes",
+    "RGBAWAttr": "dmxld.attributes",
+    "StrobeAttr": "dmxld.attributes",
+    "PanAttr": "dmxld.attributes",
+    "TiltAttr": "dmxld.attributes",
+    "GoboAttr": "dmxld.attributes",
+    "SkipAttr": "dmxld.attributes",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __all__ = [
     # Model
     "Vec3",
@@ -50,6 +88,8 @@ __all__ = [
     "BlendOp",
     "FixtureDelta",
     "apply_delta",
+    "apply_delta_inplace",
+    "apply_deltas_inplace",
     "merge_deltas",
     "scale_deltas",
     "scale_deltas_into",
@@ -60,6 +100,7 @@ __all__ = [
     "Scene",
     "EffectClip",
     "fade",
+    "fade_batch",
     # Engine
     "DMXEngine",
     "Protocol",
@@ -2,23 +2,63 @@
 
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
 if TYPE_CHECKING:
     from dmxld.color import ColorStrategy
 
 
-def _to_dmx(v: float) -> int:
-    return max(0, min(255, int(v * 255)))
+# 8-bit quantize of a 0.0-1.0 value v: max(0, min(255, int(v * 255))) without
+# the builtin calls. Kept as source so _compile_encoder() inlines exactly this
+# expression into generated encoders; _to_dmx() is compiled from it.
+_TO_DMX_EXPR = "0 if v <= 0.0 else 255 if v >= 1.0 else int(v * 255)"
+_to_dmx: Callable[[float], int] = eval(f"lambda v: {_TO_DMX_EXPR}")
+
+
+def _to_dmx_into(values: Sequence[float], buf: bytearray, offset: int) -> None:
+    """Quantize a run of 0.0-1.0 values into buf starting at offset."""
+    buf[offset:offset + len(values)] = bytes(map(_to_dmx, values))
+
+
+def _to_dmx_16bit_value(v: float) -> int:
+    return 0 if v <= 0.0 else 65535 if v >= 1.0 else int(v * 65535)
 
 
 def _to_dmx_16bit(v: float) -> tuple[int, int]:
-    val = max(0, min(65535, int(v * 65535)))
+    val = _to_dmx_16bit_value(v)
     return (val >> 8, val & 0xFF)
 
 
-@dataclass
+_pack_u16_into = struct.Struct(">H").pack_into
+
+
+def _to_dmx_16bit_into(v: float, buf: bytearray, offset: int) -> None:
+    """Write a 0.0-1.0 value as big-endian coarse/fine bytes at offset."""
+    _pack_u16_into(buf, offset, _to_dmx_16bit_value(v))
+
+
+# Scenes hold the same color for many frames, so conversions are memoized on
+# (r, g, b, resolved strategy, boost). All inputs are hashable floats/strings.
+@lru_cache(maxsize=4096)
+def _rgb_to_rgbw_cached(
+    r: float, g: float, b: float, strategy: ColorStrategy, boost: float
+) -> tuple[float, float, float, float]:
+    from dmxld.color import rgb_to_rgbw
+    return rgb_to_rgbw(r, g, b, strategy, boost=boost)
+
+
+@lru_cache(maxsize=4096)
+def _rgb_to_rgba_cached(
+    r: float, g: float, b: float, strategy: ColorStrategy, boost: float
+) -> tuple[float, float, float, float]:
+    from dmxld.color import rgb_to_rgba
+    return rgb_to_rgba(r, g, b, strategy, boost=boost)
+
+
+@dataclass(slots=True)
 class DimmerAttr:
     """Single-channel dimmer attribute."""
 
@@ -39,8 +79,14 @@ class DimmerAttr:
             return [coarse, fine]
         return [_to_dmx(value)]
 
+    def encode_into(self, value: float, buf: bytearray, offset: int) -> None:
+        if self.fine:
+            _to_dmx_16bit_into(value, buf, offset)
+        else:
+            buf[offset] = _to_dmx(value)
 
-@dataclass
+
+@dataclass(slots=True)
 class RGBAttr:
     """3-channel RGB color attribute.
 
@@ -79,8 +125,11 @@ class RGBAttr:
     def encode(self, value: tuple[float, ...]) -> list[int]:
         return [_to_dmx(value[0]), _to_dmx(value[1]), _to_dmx(value[2])]
 
+    def encode_into(self, value: tuple[float, ...], buf: bytearray, offset: int) -> None:
+        _to_dmx_into(value[:3], buf, offset)
+
 
-@dataclass
+@dataclass(slots=True)
 class RGBWAttr:
     """4-channel RGBW color attribute.
 
@@ -109,17 +158,20 @@ class RGBWAttr:
         if len(color) >= 4:
             return (color[0], color[1], color[2], color[3])
         # Convert RGB to RGBW
-        from dmxld.color import rgb_to_rgbw
+        from dmxld.color import get_color_strategy
         r = color[0] if len(color) > 0 else 0.0
         g = color[1] if len(color) > 1 else 0.0
         b = color[2] if len(color) > 2 else 0.0
-        return rgb_to_rgbw(r, g, b, self.strategy, boost=boost)
+        return _rgb_to_rgbw_cached(r, g, b, self.strategy or get_color_strategy(), boost)
 
     def encode(self, value: tuple[float, ...]) -> list[int]:
         return [_to_dmx(v) for v in value[:4]]
 
+    def encode_into(self, value: tuple[float, ...], buf: bytearray, offset: int) -> None:
+        _to_dmx_into(value[:4], buf, offset)
+
 
-@dataclass
+@dataclass(slots=True)
 class RGBAAttr:
     """4-channel RGBA (Red, Green, Blue, Amber) color attribute.
 
@@ -148,17 +200,20 @@ class RGBAAttr:
         if len(color) >= 4:
             return (color[0], color[1], color[2], color[3])
         # Convert RGB to RGBA
-        from dmxld.color import rgb_to_rgba
+        from dmxld.color import get_color_strategy
         r = color[0] if len(color) > 0 else 0.0
         g = color[1] if len(color) > 1 else 0.0
         b = color[2] if len(color) > 2 else 0.0
-        return rgb_to_rgba(r, g, b, self.strategy, boost=boost)
+        return _rgb_to_rgba_cached(r, g, b, self.strategy or get_color_strategy(), boost)
 
     def encode(self, value: tuple[float, ...]) -> list[int]:
         return [_to_dmx(v) for v in value[:4]]
 
+    def encode_into(self, value: tuple[float, ...], buf: bytearray, offset: int) -> None:
+        _to_dmx_into(value[:4], buf, offset)
 
-@dataclass
+
+@dataclass(slots=True)
 class RGBAWAttr:
     """5-channel RGBAW (Red, Green, Blue, Amber, White) color attribute.
 
@@ -189,23 +244,27 @@ class RGBAWAttr:
         if len(color) >= 5:
             return (color[0], color[1], color[2], color[3], color[4])
         # Convert from RGB: extract both amber and white
-        from dmxld.color import rgb_to_rgba, rgb_to_rgbw
+        from dmxld.color import get_color_strategy
         r = color[0] if len(color) > 0 else 0.0
         g = color[1] if len(color) > 1 else 0.0
         b = color[2] if len(color) > 2 else 0.0
+        strategy = self.strategy or get_color_strategy()
 
         # First extract white
-        r_w, g_w, b_w, w = rgb_to_rgbw(r, g, b, self.strategy, boost=boost)
+        r_w, g_w, b_w, w = _rgb_to_rgbw_cached(r, g, b, strategy, boost)
         # Then extract amber from remaining RGB
-        r_out, g_out, b_out, a = rgb_to_rgba(r_w, g_w, b_w, self.strategy, boost=boost)
+        r_out, g_out, b_out, a = _rgb_to_rgba_cached(r_w, g_w, b_w, strategy, boost)
 
         return (r_out, g_out, b_out, a, w)
 
     def encode(self, value: tuple[float, ...]) -> list[int]:
         return [_to_dmx(v) for v in value[:5]]
 
+    def encode_into(self, value: tuple[float, ...], buf: bytearray, offset: int) -> None:
+        _to_dmx_into(value[:5], buf, offset)
+
 
-@dataclass
+@dataclass(slots=True)
 class StrobeAttr:
     """Single-channel strobe attribute."""
 
@@ -222,8 +281,11 @@ class StrobeAttr:
     def encode(self, value: float) -> list[int]:
         return [_to_dmx(value)]
 
+    def encode_into(self, value: float, buf: bytearray, offset: int) -> None:
+        buf[offset] = _to_dmx(value)
+
 
-@dataclass
+@dataclass(slots=True)
 class PanAttr:
     """Pan position attribute (optional 16-bit)."""
 
@@ -244,8 +306,14 @@ class PanAttr:
             return [coarse, fine]
         return [_to_dmx(value)]
 
+    def encode_into(self, value: float, buf: bytearray, offset: int) -> None:
+        if self.fine:
+            _to_dmx_16bit_into(value, buf, offset)
+        else:
+            buf[offset] = _to_dmx(value)
+
 
-@dataclass
+@dataclass(slots=True)
 class TiltAttr:
     """Tilt position attribute (optional 16-bit)."""
 
@@ -266,8 +334,14 @@ class TiltAttr:
             return [coarse, fine]
         return [_to_dmx(value)]
 
+    def encode_into(self, value: float, buf: bytearray, offset: int) -> None:
+        if self.fine:
+            _to_dmx_16bit_into(value, buf, offset)
+        else:
+            buf[offset] = _to_dmx(value)
+
 
-@dataclass
+@dataclass(slots=True)
 class GoboAttr:
     """Gobo wheel selection attribute."""
 
@@ -284,8 +358,11 @@ class GoboAttr:
     def encode(self, value: float) -> list[int]:
         return [_to_dmx(value)]
 
+    def encode_into(self, value: float, buf: bytearray, offset: int) -> None:
+        buf[offset] = _to_dmx(value)
+
 
-@dataclass
+@dataclass(slots=True)
 class SkipAttr:
     """Placeholder for skipped/unused channels."""
 
@@ -305,3 +382,6 @@ class SkipAttr:
 
     def encode(self, value: Any) -> list[int]:
         return [0] * self.count
+
+    def encode_into(self, value: Any, buf: bytearray, offset: int) -> None:
+        buf[offset:offset + self.count] = bytes(self.count)
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 from dmxld.color import Color
-from dmxld.model import FixtureState
+from dmxld.model import Fixture, FixtureState
 
 
 class BlendOp(Enum):
@@ -18,7 +18,13 @@ class BlendOp(Enum):
 
 
 class FixtureDelta(dict[str, tuple[BlendOp, Any]]):
-    """Fixture delta. Just a dict with keyword constructor."""
+    """Fixture delta. Just a dict with keyword constructor.
+
+    Values stay floats until encode: 16-bit (fine) pan/tilt channels and MUL
+    blends need more than 8 bits, so quantizing happens once, in encode_into.
+    """
+
+    __slots__ = ()
 
     def __init__(self, **kwargs: tuple[BlendOp, Any]) -> None:
         super().__init__(kwargs)
@@ -29,53 +35,92 @@ class FixtureDelta(dict[str, tuple[BlendOp, Any]]):
 
     def scale(self, factor: float) -> FixtureDelta:
         """Return new FixtureDelta with all values scaled by factor."""
-        result = FixtureDelta()
-        for name, (op, value) in self.items():
-            if isinstance(value, Color):
-                result[name] = (op, Color(*(v * factor for v in value), boost=value.boost * factor))
-            elif isinstance(value, (tuple, list)):
-                result[name] = (op, tuple(v * factor for v in value))
-            elif isinstance(value, (int, float)):
-                result[name] = (op, value * factor)
-            else:
-                result[name] = (op, value)
-        return result
+        return self.scale_into(factor, FixtureDelta())
 
     def scale_into(self, factor: float, out: FixtureDelta) -> FixtureDelta:
         """Scale values into an existing FixtureDelta, reusing the object."""
         out.clear()
+        scale_by_type = _SCALE_BY_TYPE
         for name, (op, value) in self.items():
-            if isinstance(value, Color):
-                out[name] = (op, Color(*(v * factor for v in value), boost=value.boost * factor))
-            elif isinstance(value, (tuple, list)):
-                out[name] = (op, tuple(v * factor for v in value))
-            elif isinstance(value, (int, float)):
-                out[name] = (op, value * factor)
-            else:
-                out[name] = (op, value)
+            scale_fn = scale_by_type.get(type(value), _scale_fallback)
+            out[name] = (op, scale_fn(value, factor))
         return out
 
 
+def _scale_number(value: float, factor: float) -> float:
+    return value * factor
+
+
+def _scale_sequence(value: tuple[float, ...] | list[float], factor: float) -> tuple[float, ...]:
+    return tuple([v * factor for v in value])
+
+
+def _scale_color(value: Color, factor: float) -> Color:
+    return Color._from_values([v * factor for v in value], value.boost * factor)
+
+
+def _scale_fallback(value: Any, factor: float) -> Any:
+    if isinstance(value, Color):
+        return _scale_color(value, factor)
+    if isinstance(value, (tuple, list)):
+        return _scale_sequence(value, factor)
+    if isinstance(value, (int, float)):
+        return _scale_number(value, factor)
+    return value
+
+
+# Exact-type dispatch for FixtureDelta.scale, mirroring _APPLY_BY_TYPE below.
+_SCALE_BY_TYPE: dict[type, Callable[[Any, float], Any]] = {
+    float: _scale_number,
+    int: _scale_number,
+    tuple: _scale_sequence,
+    list: _scale_sequence,
+    Color: _scale_color,
+}
+
+
 def _clamp(v: float, lo: float = 0.0, hi: float = 1.0) -> float:
-    return max(lo, min(hi, v))
+    return lo if v < lo else hi if v > hi else v
 
 
-def _apply_scalar_op(current: float, op: BlendOp, value: float) -> float:
-    if op == BlendOp.SET:
-        return value
-    if op == BlendOp.ADD_CLAMP:
-        return _clamp(current + value)
-    if op == BlendOp.MUL:
-        return _clamp(current * value)
+def _set_value(current: float, value: float) -> float:
+    return value
+
+
+def _add_clamp(current: float, value: float) -> float:
+    return _clamp(current + value)
+
+
+def _mul_clamp(current: float, value: float) -> float:
+    return _clamp(current * value)
+
+
+def _keep_current(current: float, value: float) -> float:
     return current
 
 
+# BlendOp -> scalar kernel, resolved with one lookup instead of a compare chain.
+_SCALAR_OPS: dict[BlendOp, Callable[[float, float], float]] = {
+    BlendOp.SET: _set_value,
+    BlendOp.ADD_CLAMP: _add_clamp,
+    BlendOp.MUL: _mul_clamp,
+}
+
+
 def _apply_tuple_op(
     current: tuple[float, ...],
     op: BlendOp,
     value: tuple[float, ...],
 ) -> tuple[float, ...]:
-    result = tuple(_apply_scalar_op(c, op, v) for c, v in zip(current, value))
+    # Branch on op once per tuple, not once per channel.
+    if op is BlendOp.SET:
+        result = tuple(v for _, v in zip(current, value))
+    elif op is BlendOp.ADD_CLAMP:
+        result = tuple(_clamp(c + v) for c, v in zip(current, value))
+    elif op is BlendOp.MUL:
+        result = tuple(_clamp(c * v) for c, v in zip(current, value))
+    else:
+        result = tuple(c for c, _ in zip(current, value))
     cur_boost = getattr(current, 'boost', 0.0)
     val_boost = getattr(value, 'boost', 0.0)
     if op == BlendOp.SET:
@@ -83,32 +128,78 @@ def _apply_tuple_op(
     else:
         boost = min(cur_boost + val_boost, 1.0)
     if boost > 0:
-        return Color(*result, boost=boost)
+        return Color._from_values(result, boost)
     return result
 
 
+def _apply_number_op(current: Any, op: BlendOp, value: float) -> float:
+    if op is BlendOp.SET:
+        return float(value)
+    current_val = float(current) if current is not None else 0.0
+    return _SCALAR_OPS.get(op, _keep_current)(current_val, float(value))
+
+
+def _apply_sequence_op(current: Any, op: BlendOp, value: Any) -> tuple[float, ...]:
+    if current is None:
+        current = tuple(0.0 for _ in value)
+    return _apply_tuple_op(current, op, value)
+
+
+# Exact-type dispatch for the value types clips actually produce, so the common
+# case is one dict probe instead of an isinstance chain.
+_APPLY_BY_TYPE: dict[type, Callable[[Any, BlendOp, Any], Any]] = {
+    float: _apply_number_op,
+    int: _apply_number_op,
+    tuple: _apply_sequence_op,
+    list: _apply_sequence_op,
+    Color: _apply_sequence_op,
+}
+
+
 def _apply_op(current: Any, op: BlendOp, value: Any) -> Any:
     """Apply blend operation to a value."""
+    apply_fn = _APPLY_BY_TYPE.get(type(value))
+    if apply_fn is not None:
+        return apply_fn(current, op, value)
     if isinstance(value, (int, float)):
-        current_val = float(current) if current is not None else 0.0
-        return _apply_scalar_op(current_val, op, float(value))
+        return _apply_number_op(current, op, value)
     elif isinstance(value, (tuple, list)):
-        if current is None:
-            current = tuple(0.0 for _ in value)
-        return _apply_tuple_op(current, op, value)
+        return _apply_sequence_op(current, op, value)
     else:
         # Unknown type, SET overwrites, others keep current
         return value if op == BlendOp.SET else current
 
 
+def apply_delta_inplace(state: FixtureState, delta: FixtureDelta) -> FixtureState:
+    """Apply a delta to a state in place, returning the same state."""
+    get = state.get
+    dispatch = _APPLY_BY_TYPE.get
+    for name, (op, value) in delta.items():
+        state[name] = dispatch(type(value), _apply_op)(get(name), op, value)
+    return state
+
+
+def apply_deltas_inplace(
+    states: dict[Fixture, FixtureState], deltas: dict[Fixture, FixtureDelta]
+) -> None:
+    """Apply per-fixture deltas to a whole rig's states in place, in one pass.
+
+    Fixtures without an entry in states are skipped. Same result as calling
+    apply_delta_inplace() per fixture, minus the per-fixture call.
+    """
+    dispatch = _APPLY_BY_TYPE.get
+    for fixture, delta in deltas.items():
+        state = states.get(fixture)
+        if state is None:
+            continue
+        get = state.get
+        for name, (op, value) in delta.items():
+            state[name] = dispatch(type(value), _apply_op)(get(name), op, value)
+
+
 def apply_delta(state: FixtureState, delta: FixtureDelta) -> FixtureState:
     """Apply a delta to a state, returning new state."""
-    new_state = state.copy()
-    for name, (op, value) in delta.items():
-        current = new_state.get(name)
-        new_value = _apply_op(current, op, value)
-        new_state[name] = new_value
-    return new_state
+    return apply_delta_inplace(state.copy(), delta)
 
 
 def merge_deltas(
@@ -116,17 +207,24 @@ def merge_deltas(
 ) -> FixtureState:
     """Merge multiple deltas into a final state."""
     state = initial.copy() if initial else FixtureState()
+    get = state.get
+    dispatch = _APPLY_BY_TYPE.get
     for delta in deltas:
-        state = apply_delta(state, delta)
+        for name, (op, value) in delta.items():
+            state[name] = dispatch(type(value), _apply_op)(get(name), op, value)
     return state
 
 
-def scale_deltas(deltas: dict, factor: float) -> dict:
+def scale_deltas(
+    deltas: dict[Fixture, FixtureDelta], factor: float
+) -> dict[Fixture, FixtureDelta]:
     """Scale all FixtureDelta values in a deltas dict by factor."""
     return {target: delta.scale(factor) for target, delta in deltas.items()}
 
 
-def scale_deltas_into(deltas: dict, factor: float, out: dict) -> dict:
+def scale_deltas_into(
+    deltas: dict[Fixture, FixtureDelta], factor: float, out: dict[Fixture, FixtureDelta]
+) -> dict[Fixture, FixtureDelta]:
     """Scale all FixtureDelta values into pre-allocated output dict."""
     for target, delta in deltas.items():
         if target not in out:
@@ -154,7 +252,7 @@ def compose_add(deltas: list[FixtureDelta]) -> FixtureDelta:
                     merged = tuple(a + b for a, b in zip(existing, value))
                     boost = min(getattr(existing, 'boost', 0.0) + getattr(value, 'boost', 0.0), 1.0)
                     if boost > 0:
-                        result[name] = (op, Color(*merged, boost=boost))
+                        result[name] = (op, Color._from_values(merged, boost))
                     else:
                         result[name] = (op, merged)
                 elif isinstance(value, (int, float)):
@@ -173,6 +271,5 @@ def compose_override(deltas: list[FixtureDelta]) -> FixtureDelta:
         return deltas[0]
     result = FixtureDelta()
     for delta in deltas:
-        for name, value in delta.items():
-            result[name] = value
+        result.update(delta)
     return result
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Iterable, Protocol
+from typing import Any, Callable, Iterable, Mapping, Protocol, Sequence
+from weakref import WeakKeyDictionary
 
 from dmxld.blend import BlendOp, FixtureDelta
 from dmxld.model import Fixture, FixtureState, Rig
@@ -29,20 +30,41 @@ ParamsFn = Callable[[Fixture], FixtureState]
 def fade(
     t: float, duration: float | None, fade_in: float, fade_out: float
 ) -> float:
-    """Calculate fade multiplier for time t (units are generic — same unit as t)."""
-    if fade_in > 0 and t < fade_in:
-        return t / fade_in
-    if duration is not None and fade_out > 0:
-        time_remaining = duration - t
-        if time_remaining < fade_out:
-            return max(0.0, time_remaining / fade_out)
-    return 1.0
+    """Calculate fade multiplier for time t (units are generic — same unit as t).
+
+    The fade-in and fade-out envelopes are computed independently and the
+    lower one wins, so overlapping fades on short clips stay continuous.
+    """
+    m_in = 1.0 if fade_in <= 0 else min(1.0, t / fade_in)
+    if duration is None or fade_out <= 0:
+        return m_in
+    return min(m_in, max(0.0, (duration - t) / fade_out))
+
+
+def fade_batch(
+    ts: Iterable[float], duration: float | None, fade_in: float, fade_out: float
+) -> list[float]:
+    """fade() over many sample times, e.g. for offline rendering or export.
+
+    The fade_in/fade_out configuration checks and the reciprocals of the fade
+    lengths are resolved once for the whole batch rather than once per sample.
+    """
+    inv_in = 1.0 / fade_in if fade_in > 0 else 0.0
+    if duration is None or fade_out <= 0:
+        if not inv_in:
+            return [1.0 for _ in ts]
+        return [min(1.0, t * inv_in) for t in ts]
+    inv_out = 1.0 / fade_out
+    if not inv_in:
+        return [min(1.0, max(0.0, (duration - t) * inv_out)) for t in ts]
+    return [min(1.0, t * inv_in, max(0.0, (duration - t) * inv_out)) for t in ts]
 
 
 Layer = tuple[Selector | Iterable[Fixture], ParamsFn | FixtureState]
 
 
-@dataclass
+# eq=False keeps identity hashing, so engines can cache per instance.
+@dataclass(eq=False)
 class Scene:
     """Static lighting look — no time dependency.
 
@@ -86,41 +108,80 @@ class Scene:
         if has_single and (self.selector is None or self.params is None):
             raise ValueError("Both selector and params are required")
         self._resolved_layers = self._resolve_layers()
-        self._render_cache = None
+        # Rendered deltas per rig, tagged with the rig version they were built at.
+        self._render_cache: WeakKeyDictionary[Rig, tuple[int, dict[Fixture, FixtureDelta]]] = (
+            WeakKeyDictionary()
+        )
 
-    def _resolve_layers(self) -> list[tuple[Selector, ParamsFn]]:
-        """Normalize single or multi-layer form into list of (selector_fn, params_fn)."""
+    def _resolve_layers(
+        self,
+    ) -> list[tuple[Selector | tuple[Fixture, ...], ParamsFn | FixtureState]]:
+        """Normalize single or multi-layer form into (selection, params) pairs.
+
+        Static selections are frozen to tuples once so renders never re-walk
+        them; render() branches on callable-ness per layer rather than going
+        through wrapper closures.
+        """
+        raw: list[Layer]
         if self.layers is not None:
             raw = self.layers
         else:
+            assert self.selector is not None and self.params is not None
             raw = [(self.selector, self.params)]
-        result = []
-        for sel, par in raw:
-            selector_fn = sel if callable(sel) else lambda r, s=sel: s
-            params_fn = par if callable(par) else lambda f, p=par: p
-            result.append((selector_fn, params_fn))
-        return result
+        return [(sel if callable(sel) else tuple(sel), par) for sel, par in raw]
 
     def render(self, rig: Rig) -> dict[Fixture, FixtureDelta]:
-        if self._render_cache is not None:
-            return self._render_cache
+        """Render deltas for rig. The result is cached and must not be mutated.
+
+        Fixtures covered only by the same static layer share one FixtureDelta.
+        """
+        cached = self._render_cache.get(rig)
+        if cached is not None and cached[0] == rig.version:
+            return cached[1]
         result: dict[Fixture, FixtureDelta] = {}
-        for selector_fn, params_fn in self._resolved_layers:
-            for fixture in selector_fn(rig):
-                state = params_fn(fixture)
-                delta = result.get(fixture) or FixtureDelta()
+        blend_op = self.blend_op
+        for selection, params in self._resolved_layers:
+            fixtures = selection(rig) if callable(selection) else selection
+            if not callable(params):
+                # Same values for every fixture: one delta shared by all of
+                # them, copied only where an earlier layer already set values.
+                shared = FixtureDelta()
+                shared.update({name: (blend_op, value) for name, value in params.items()})
+                for fixture in fixtures:
+                    existing = result.get(fixture)
+                    if existing is None:
+                        result[fixture] = shared
+                    else:
+                        delta = result[fixture] = FixtureDelta()
+                        delta.update(existing)
+                        delta.update(shared)
+                continue
+            for fixture in fixtures:
+                state = params(fixture)
+                delta = FixtureDelta()
+                existing = result.get(fixture)
+                if existing:
+                    delta.update(existing)
                 for name, value in state.items():
-                    delta[name] = (self.blend_op, value)
+                    delta[name] = (blend_op, value)
                 result[fixture] = delta
-        self._render_cache = result
+        self._render_cache[rig] = (rig.version, result)
         return result
 
 
 # Type for effect params function: (t, fixture, index, segment) -> FixtureState
 EffectParamsFn = Callable[[float, Fixture, int, int], FixtureState]
 
+# Type for batch params function: (t, count) -> {attribute: value per index}
+EffectBatchFn = Callable[[float, int], Mapping[str, Sequence[Any]]]
+
+
+def _all_unsegmented(fixtures: tuple[Fixture, ...]) -> bool:
+    return all(len(f.fixture_type.color_keys) == 1 for f in fixtures)
 
-@dataclass
+
+# eq=False for identity hashing, as with Scene.
+@dataclass(eq=False)
 class EffectClip:
     """Math-driven effect with access to time, fixture, index, and segment.
 
@@ -131,10 +192,19 @@ class EffectClip:
     function is called once per segment. The segment index can be used to create
     per-segment animations. Non-segmented fixtures always have segment=0.
 
+    The selector is evaluated once per rig and re-evaluated only after fixtures
+    are added to that rig, so it should not depend on time or external state.
+
     Args:
         blend_op: How to combine with other clips (SET overwrites, MUL multiplies,
                   ADD_CLAMP adds). Defaults to SET. Use MUL to layer dimmer
                   modulation on top of other clips.
+        dimmer_only: Declares that params only ever returns a dimmer value.
+                     Lets the clip skip calling params while fully faded out.
+        params_batch: Optional (t, count) -> {attribute: values} computing
+                      segment 0 for indices 0..count-1 in one call. Must agree
+                      with params; used instead of it when no selected fixture
+                      is segmented.
 
     Example - color wave across fixtures by X position:
         EffectClip(
@@ -162,34 +232,136 @@ class EffectClip:
     fade_out: float = 0.0
     clip_duration: float | None = None
     blend_op: BlendOp = BlendOp.SET
+    dimmer_only: bool = False
+    params_batch: EffectBatchFn | None = None
+
+    def __post_init__(self) -> None:
+        # A static selection does not depend on the rig: resolve it once here.
+        self._static_selection: tuple[tuple[Fixture, ...], bool] | None = None
+        if callable(self.selector):
+            self._selector_fn: Selector = self.selector
+        else:
+            selected = tuple(self.selector)
+            self._selector_fn = lambda r: selected
+            self._static_selection = (selected, _all_unsegmented(selected))
+        # Selector results per rig, tagged with the rig version they were taken
+        # at, plus whether every selected fixture is unsegmented.
+        self._selection_cache: WeakKeyDictionary[
+            Rig, tuple[int, tuple[Fixture, ...], bool]
+        ] = WeakKeyDictionary()
+
+    def _select(self, rig: Rig) -> tuple[tuple[Fixture, ...], bool]:
+        """Selector result for rig, re-evaluated only when the rig changes."""
+        if self._static_selection is not None:
+            return self._static_selection
+        cached = self._selection_cache.get(rig)
+        if cached is not None and cached[0] == rig.version:
+            return cached[1], cached[2]
+        selected = tuple(self._selector_fn(rig))
+        unsegmented = _all_unsegmented(selected)
+        self._selection_cache[rig] = (rig.version, selected, unsegmented)
+        return selected, unsegmented
+
+    def prepare(self, rig: Rig) -> None:
+        """Resolve the selection for rig now rather than on the first render.
+
+        Renders then only read the selection caches, so call this on the
+        owning thread before rendering the clip from other threads.
+        """
+        self._select(rig)
 
     @property
     def duration(self) -> float | None:
         return self.clip_duration
 
     def render(self, t: float, rig: Rig) -> dict[Fixture, FixtureDelta]:
-        if t < 0 or (self.clip_duration is not None and t > self.clip_duration):
-            return {}
-
-        fade_mult = fade(t, self.clip_duration, self.fade_in, self.fade_out)
-        selector_fn = self.selector if callable(self.selector) else lambda r: self.selector
-
-        result: dict[Fixture, FixtureDelta] = {}
-        for idx, fixture in enumerate(selector_fn(rig)):
-            delta = FixtureDelta()
-            segment_count = fixture.segment_count
-
-            for seg in range(segment_count):
-                state = self.params(t, fixture, idx, seg)
+        return self.render_into(t, rig, {})
+
+    def render_into(
+        self, t: float, rig: Rig, out: dict[Fixture, FixtureDelta]
+    ) -> dict[Fixture, FixtureDelta]:
+        """Render into an existing deltas dict, reusing its FixtureDelta objects.
+
+        Fixtures no longer selected are dropped from out. Intended for render
+        loops that keep one output dict per clip across frames.
+        """
+        clip_duration = self.clip_duration
+        if t < 0 or (clip_duration is not None and t > clip_duration):
+            out.clear()
+            return out
+
+        fade_in = self.fade_in
+        fade_out = self.fade_out
+        if fade_in > 0 or (clip_duration is not None and fade_out > 0):
+            fade_mult = fade(t, clip_duration, fade_in, fade_out)
+        else:
+            fade_mult = 1.0
+        params = self.params
+        blend_op = self.blend_op
+
+        # A fully faded dimmer-only clip can only contribute dimmer=0: nothing at
+        # all under ADD_CLAMP, and a known value otherwise, so params is skipped.
+        faded_out = self.dimmer_only and fade_mult <= 0.0
+        if faded_out and blend_op is BlendOp.ADD_CLAMP:
+            out.clear()
+            return out
+
+        fixtures, unsegmented = self._select(rig)
+        stale = set(out) if out else None
+        deltas: list[FixtureDelta] = []
+        for fixture in fixtures:
+            delta = out.get(fixture)
+            if delta is None:
+                delta = out[fixture] = FixtureDelta()
+            else:
+                delta.clear()
+                if stale is not None:
+                    stale.discard(fixture)
+            deltas.append(delta)
+        if stale:
+            for fixture in stale:
+                del out[fixture]
+
+        if faded_out:
+            entry = (blend_op, 0.0)
+            for delta in deltas:
+                delta["dimmer"] = entry
+            return out
+
+        batch = self.params_batch
+        if batch is not None and unsegmented:
+            # One call for all fixtures, filled in attribute by attribute.
+            for name, values in batch(t, len(deltas)).items():
+                if name == "dimmer" and fade_mult != 1.0:
+                    for delta, value in zip(deltas, values):
+                        delta[name] = (blend_op, value * fade_mult)
+                else:
+                    for delta, value in zip(deltas, values):
+                        delta[name] = (blend_op, value)
+            return out
+
+        for idx, (fixture, delta) in enumerate(zip(fixtures, deltas)):
+            color_keys = fixture.fixture_type.color_keys
+            if len(color_keys) == 1:
+                # Common case: one params call, no segment key rewriting, and
+                # the fade is applied to dimmer afterwards only if it is active.
+                for name, value in params(t, fixture, idx, 0).items():
+                    delta[name] = (blend_op, value)
+                if fade_mult != 1.0:
+                    dimmer = delta.get("dimmer")
+                    if dimmer is not None:
+                        delta["dimmer"] = (blend_op, dimmer[1] * fade_mult)
+                continue
+
+            for seg, color_key in enumerate(color_keys):
+                state = params(t, fixture, idx, seg)
 
                 for name, value in state.items():
                     if name == "dimmer":
                         if seg == 0:
-                            delta[name] = (self.blend_op, value * fade_mult)
-                    elif name == "color" and segment_count > 1:
-                        delta[f"color_{seg}"] = (self.blend_op, value)
+                            delta[name] = (blend_op, value * fade_mult)
+                    elif name == "color":
+                        delta[color_key] = (blend_op, value)
                     else:
-                        delta[name] = (self.blend_op, value)
-
-            result[fixture] = delta
-        return result
+                        delta[name] = (blend_op, value)
+        return out
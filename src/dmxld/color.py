@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from functools import cached_property
+from typing import Iterable, Literal
 
 # Color conversion strategies
 ColorStrategy = Literal["balanced", "preserve_rgb", "max_white"]
@@ -46,8 +47,9 @@ def hsv_to_rgb(h: float, s: float, v: float) -> tuple[float, float, float]:
     """
     if s == 0.0:
         return (v, v, v)
-    i = int(h * 6.0)
-    f = (h * 6.0) - i
+    h6 = h * 6.0
+    i = int(h6)
+    f = h6 - i
     p = v * (1.0 - s)
     q = v * (1.0 - s * f)
     t = v * (1.0 - s * (1.0 - f))
@@ -130,16 +132,11 @@ def rgb_to_rgbw(
         return (r, g, b, 0.0)
 
     if strategy == "max_white":
-        # Maximize white LED usage
+        # Maximize white LED usage. Scaling the remainder by (1 - w) / (1 - w)
+        # cancels out, and each channel is >= w, so this is a plain subtraction.
         w = min(r, g, b)
-        if w > 0:
-            # Scale remaining RGB to compensate
-            remaining = 1.0 - w
-            if remaining > 0:
-                r_out = (r - w) / (1.0 - w) * remaining if r > w else 0.0
-                g_out = (g - w) / (1.0 - w) * remaining if g > w else 0.0
-                b_out = (b - w) / (1.0 - w) * remaining if b > w else 0.0
-                return (r_out, g_out, b_out, w)
+        if 0.0 < w < 1.0:
+            return (r - w, g - w, b - w, w)
         return (r, g, b, 0.0)
 
     # Default "balanced" strategy: extract common white component
@@ -196,19 +193,13 @@ def rgb_to_rgba(
     if b > 0.5:
         return (r, g, b, 0.0)
 
-    # Extract amber from the "warm" component
-    # Amber ≈ (1.0, 0.75, 0.0)
-    if g > 0:
-        amber = min(r, g / 0.75)
-    else:
-        amber = 0.0
-
-    amber = min(amber, 1.0 - b)
-    amber = max(0.0, amber)
+    # Extract amber from the "warm" component, capped so blue headroom stays.
+    # Amber ≈ (1.0, 0.75, 0.0); g <= 0 yields no amber via the outer max.
+    amber = max(0.0, min(r, g / 0.75, 1.0 - b))
 
-    keep = max(0.0, min(1.0, boost))
-    r_out = max(0.0, r - amber * (1 - keep))
-    g_out = max(0.0, g - amber * 0.75 * (1 - keep))
+    spend = 1 - max(0.0, min(1.0, boost))
+    r_out = max(0.0, r - amber * spend)
+    g_out = max(0.0, g - amber * 0.75 * spend)
 
     return (r_out, g_out, b, amber)
 
@@ -248,11 +239,20 @@ class Color(tuple[float, ...]):
         color.hsv                       # Get HSV tuple
     """
 
+    boost: float
+
     def __new__(cls, *values: float, boost: float = 0.0) -> Color:
         instance = super().__new__(cls, values)
         instance.boost = boost
         return instance
 
+    @classmethod
+    def _from_values(cls, values: Iterable[float], boost: float) -> Color:
+        """Build from an iterable without *args packing (blend hot path)."""
+        instance = tuple.__new__(cls, values)
+        instance.boost = boost
+        return instance
+
     @classmethod
     def from_hsv(cls, h: float, s: float, v: float, boost: float = 0.0) -> Color:
         """Create a Color from HSV values.
@@ -266,20 +266,32 @@ class Color(tuple[float, ...]):
         r, g, b = hsv_to_rgb(h, s, v)
         return cls(r, g, b, boost=boost)
 
+    # r/g/b are almost always present, so index first and only pay for the
+    # exception on short colors; w is usually absent, so it checks the length.
+
     @property
     def r(self) -> float:
         """Red channel."""
-        return self[0] if len(self) > 0 else 0.0
+        try:
+            return self[0]
+        except IndexError:
+            return 0.0
 
     @property
     def g(self) -> float:
         """Green channel."""
-        return self[1] if len(self) > 1 else 0.0
+        try:
+            return self[1]
+        except IndexError:
+            return 0.0
 
     @property
     def b(self) -> float:
         """Blue channel."""
-        return self[2] if len(self) > 2 else 0.0
+        try:
+            return self[2]
+        except IndexError:
+            return 0.0
 
     @property
     def w(self) -> float:
@@ -289,12 +301,15 @@ class Color(tuple[float, ...]):
     @property
     def rgb(self) -> tuple[float, float, float]:
         """Get RGB representation."""
+        if len(self) >= 3:
+            return (self[0], self[1], self[2])
         return (self.r, self.g, self.b)
 
-    @property
+    @cached_property
     def hsv(self) -> tuple[float, float, float]:
-        """Get HSV representation."""
-        return rgb_to_hsv(self.r, self.g, self.b)
+        """Get HSV representation (computed once; colors are immutable)."""
+        r, g, b = self.rgb
+        return rgb_to_hsv(r, g, b)
 
     def __repr__(self) -> str:
         values = ", ".join(f"{v}" for v in self)
@@ -335,6 +350,8 @@ class Raw(tuple[float, ...]):
         FixtureState(color=(1.0, 0.0, 0.0))  # RGB → converted to fixture's format
     """
 
+    __slots__ = ()
+
     def __new__(cls, *values: float) -> Raw:
         return super().__new__(cls, values)
 
@@ -4,16 +4,45 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable
 
 from dmxld.clips import EffectClip, Selector
-from dmxld.color import Color
+from dmxld.color import Color, hsv_to_rgb
 from dmxld.model import Fixture, FixtureState
 
 if TYPE_CHECKING:
     from dmxld.model import FixtureGroup
 
 
+def _sine_level(cycles: float) -> float:
+    """Dimmer level 0.0-1.0 of a sine wave, cycles in whole periods."""
+    return 0.5 + 0.5 * math.sin(cycles * math.tau)
+
+
+def _chase_level(pos: float, i: int, n: int, width: float) -> float:
+    """Dimmer level of fixture i with a chase of the given width at pos on a ring of n."""
+    # Wrap-around distance on the ring, with abs/min/max written inline.
+    distance = i - pos
+    if distance < 0:
+        distance = -distance
+    if distance * 2 > n:
+        distance = n - distance
+    value = 1.0 - distance / width
+    return value if value > 0.0 else 0.0
+
+
+def _pairs_with_render_params(cls: type, name: str) -> bool:
+    """True if cls gets name from the same class that defines its render_params.
+
+    render_batch and dimmer_only describe one specific render_params, so a
+    subclass that overrides only render_params must not inherit them.
+    """
+    def owner(attr: str) -> type:
+        return next(c for c in cls.__mro__ if attr in c.__dict__)
+
+    return owner(name) is owner("render_params")
+
+
 class EffectTemplate:
     """Base class for effect templates.
 
@@ -31,6 +60,10 @@ class EffectTemplate:
         clip = MyEffect(speed=2.0)(front, duration=10.0)
     """
 
+    # True when this class's render_params only ever sets dimmer (see
+    # EffectClip.dimmer_only). Not trusted by subclasses that override it.
+    dimmer_only: ClassVar[bool] = False
+
     def render_params(self, t: float, f: Fixture, i: int, seg: int) -> FixtureState:
         """Override to define the effect behavior.
 
@@ -45,6 +78,15 @@ class EffectTemplate:
         """
         raise NotImplementedError
 
+    def render_batch(self, t: float, count: int) -> dict[str, list[Any]]:
+        """Optionally override to render many fixtures in one call.
+
+        Returns {attribute: values} for fixture indices 0..count-1 at segment
+        0, matching what render_params would return for each. Used in place
+        of render_params when none of the selected fixtures are segmented.
+        """
+        raise NotImplementedError
+
     @property
     def name(self) -> str:
         """Effect name derived from class and attributes."""
@@ -69,6 +111,15 @@ class EffectTemplate:
             clip_duration=duration,
             fade_in=fade_in,
             fade_out=fade_out,
+            dimmer_only=(
+                self.dimmer_only and _pairs_with_render_params(type(self), "dimmer_only")
+            ),
+            params_batch=(
+                self.render_batch
+                if type(self).render_batch is not EffectTemplate.render_batch
+                and _pairs_with_render_params(type(self), "render_batch")
+                else None
+            ),
         )
 
     def __call__(
@@ -101,11 +152,16 @@ class Pulse(EffectTemplate):
         clip = Pulse(rate=2.0)(front, duration=10.0)
     """
 
+    dimmer_only = True
+
     rate: float = 1.0
 
     def render_params(self, t: float, f: Fixture, i: int, seg: int) -> FixtureState:
-        value = 0.5 + 0.5 * math.sin(t * self.rate * 2 * math.pi)
-        return FixtureState(dimmer=value)
+        return FixtureState(dimmer=_sine_level(t * self.rate))
+
+    def render_batch(self, t: float, count: int) -> dict[str, list[Any]]:
+        value = _sine_level(t * self.rate)
+        return {"dimmer": [value] * count}
 
 
 @dataclass
@@ -121,16 +177,22 @@ class Chase(EffectTemplate):
         clip = Chase(fixture_count=8, speed=2.0)(back, duration=10.0)
     """
 
+    dimmer_only = True
+
     fixture_count: int
     speed: float = 1.0
     width: float = 1.0
 
     def render_params(self, t: float, f: Fixture, i: int, seg: int) -> FixtureState:
-        position = (t * self.speed) % self.fixture_count
-        distance = abs(i - position)
-        distance = min(distance, self.fixture_count - distance)
-        value = max(0.0, 1.0 - distance / self.width)
-        return FixtureState(dimmer=value)
+        n = self.fixture_count
+        position = (t * self.speed) % n
+        return FixtureState(dimmer=_chase_level(position, i, n, self.width))
+
+    def render_batch(self, t: float, count: int) -> dict[str, list[Any]]:
+        n = self.fixture_count
+        width = self.width
+        position = (t * self.speed) % n
+        return {"dimmer": [_chase_level(position, i, n, width) for i in range(count)]}
 
 
 @dataclass
@@ -151,8 +213,14 @@ class Rainbow(EffectTemplate):
     def render_params(self, t: float, f: Fixture, i: int, seg: int) -> FixtureState:
         # Phase by fixture index and segment for smooth rainbow across segments
         hue = (t * self.speed + i * 0.1 + seg * 0.05) % 1.0
-        color = Color.from_hsv(hue, self.saturation, 1.0)
-        return FixtureState(dimmer=1.0, color=color)
+        # Plain RGB tuple: no boost to carry, so no Color subclass to build.
+        return FixtureState(dimmer=1.0, color=hsv_to_rgb(hue, self.saturation, 1.0))
+
+    def render_batch(self, t: float, count: int) -> dict[str, list[Any]]:
+        base = t * self.speed
+        saturation = self.saturation
+        colors = [hsv_to_rgb((base + i * 0.1) % 1.0, saturation, 1.0) for i in range(count)]
+        return {"dimmer": [1.0] * count, "color": colors}
 
 
 @dataclass
@@ -167,6 +235,8 @@ class Strobe(EffectTemplate):
         clip = Strobe(rate=10.0, duty=0.3)(front, duration=5.0)
     """
 
+    dimmer_only = True
+
     rate: float = 10.0
     duty: float = 0.5
 
@@ -175,6 +245,10 @@ class Strobe(EffectTemplate):
         value = 1.0 if phase < self.duty else 0.0
         return FixtureState(dimmer=value)
 
+    def render_batch(self, t: float, count: int) -> dict[str, list[Any]]:
+        phase = (t * self.rate) % 1.0
+        return {"dimmer": [1.0 if phase < self.duty else 0.0] * count}
+
 
 @dataclass
 class Wave(EffectTemplate):
@@ -188,13 +262,21 @@ class Wave(EffectTemplate):
         clip = Wave(speed=0.5, wavelength=8.0)(front, duration=10.0)
     """
 
+    dimmer_only = True
+
     speed: float = 1.0
     wavelength: float = 4.0
 
     def render_params(self, t: float, f: Fixture, i: int, seg: int) -> FixtureState:
-        phase = t * self.speed - i / self.wavelength
-        value = 0.5 + 0.5 * math.sin(phase * 2 * math.pi)
-        return FixtureState(dimmer=value)
+        return FixtureState(dimmer=_sine_level(t * self.speed - i / self.wavelength))
+
+    def render_batch(self, t: float, count: int) -> dict[str, list[Any]]:
+        # _sine_level inlined, with the angle at index 0 and the per-index step
+        # computed once per frame so each fixture is one multiply-subtract.
+        start = t * self.speed * math.tau
+        step = math.tau / self.wavelength
+        sin = math.sin
+        return {"dimmer": [0.5 + 0.5 * sin(start - i * step) for i in range(count)]}
 
 
 @dataclass
@@ -213,7 +295,11 @@ class Solid(EffectTemplate):
     color: tuple[float, float, float] | Color | None = None
 
     def render_params(self, t: float, f: Fixture, i: int, seg: int) -> FixtureState:
-        state = FixtureState(dimmer=self.dimmer)
-        if self.color is not None:
-            state["color"] = self.color
-        return state
+        if self.color is None:
+            return FixtureState(dimmer=self.dimmer)
+        return FixtureState(dimmer=self.dimmer, color=self.color)
+
+    def render_batch(self, t: float, count: int) -> dict[str, list[Any]]:
+        if self.color is None:
+            return {"dimmer": [self.dimmer] * count}
+        return {"dimmer": [self.dimmer] * count, "color": [self.color] * count}
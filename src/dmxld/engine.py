@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING
+from queue import SimpleQueue
+from typing import TYPE_CHECKING, Mapping, Sequence
+from weakref import WeakKeyDictionary
 
-from dmxld.blend import FixtureDelta, merge_deltas
+from dmxld.blend import FixtureDelta, apply_deltas_inplace
 from dmxld.clips import Clip, Scene
+from dmxld.color import ColorStrategy, get_color_strategy
 from dmxld.model import Fixture, FixtureState, Rig
 
 if TYPE_CHECKING:
@@ -23,6 +29,16 @@ class Protocol(Enum):
     ARTNET = "artnet"
 
 
+def _pack_universe(channels: dict[int, int] | None) -> bytearray:
+    """Pack {channel: value} (channels 1-512) into a 512-byte DMX payload."""
+    packet = bytearray(512)
+    if channels:
+        for ch, val in channels.items():
+            if 1 <= ch <= 512:
+                packet[ch - 1] = val
+    return packet
+
+
 class _Transport(ABC):
     @abstractmethod
     def start(self) -> None:
@@ -32,6 +48,14 @@ class _Transport(ABC):
     def send(self, universe_data: dict[int, dict[int, int]]) -> None:
         ...
 
+    @abstractmethod
+    def send_buffers(self, buffers: Mapping[int, bytes | bytearray]) -> None:
+        """Send 513-byte universe buffers (slot 0 is the start code).
+
+        Buffers must not be mutated after hand-off; transports may keep
+        zero-copy views of them.
+        """
+
     @abstractmethod
     def stop(self) -> None:
         ...
@@ -61,9 +85,13 @@ class _SACNTransport(_Transport):
 
     def send(self, universe_data: dict[int, dict[int, int]]) -> None:
         for u in self._universes:
-            data = universe_data.get(u, {})
-            dmx = tuple(data.get(ch, 0) for ch in range(1, 513))
-            self._sender[u].dmx_data = dmx
+            self._sender[u].dmx_data = _pack_universe(universe_data.get(u))
+
+    def send_buffers(self, buffers: Mapping[int, bytes | bytearray]) -> None:
+        for u in self._universes:
+            buf = buffers.get(u)
+            if buf is not None:
+                self._sender[u].dmx_data = memoryview(buf)[1:]
 
     def stop(self) -> None:
         self._sender.stop()
@@ -93,30 +121,114 @@ class _ArtNetTransport(_Transport):
 
     def send(self, universe_data: dict[int, dict[int, int]]) -> None:
         for u, sender in self._senders.items():
-            data = universe_data.get(u, {})
-            packet = bytearray(512)
-            for ch, val in data.items():
-                if 1 <= ch <= 512:
-                    packet[ch - 1] = val
-            sender.set(packet)
+            sender.set(_pack_universe(universe_data.get(u)))
+
+    def send_buffers(self, buffers: Mapping[int, bytes | bytearray]) -> None:
+        for u, sender in self._senders.items():
+            buf = buffers.get(u)
+            if buf is not None:
+                # Zero-copy view; the engine only hands over immutable snapshots
+                sender.set(memoryview(buf)[1:])
 
     def stop(self) -> None:
         for sender in self._senders.values():
             sender.stop()
 
 
+class _SendWorker:
+    """Background thread that forwards the newest frame to a transport.
+
+    The render side never blocks on the network: frames go into a two-slot
+    deque and the worker only sends the most recent one, dropping stale frames.
+    A failed send does not stop the worker; the error is re-raised from the
+    next submit() or from stop().
+    """
+
+    def __init__(self, transport: _Transport) -> None:
+        self._transport = transport
+        self._frames: deque[dict[int, bytes]] = deque(maxlen=2)
+        self._wake = threading.Event()
+        self._running = False
+        self._thread: threading.Thread | None = None
+        self._errors: SimpleQueue[Exception] = SimpleQueue()
+
+    def start(self) -> None:
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="dmxld-send", daemon=True)
+        self._thread.start()
+
+    def submit(self, frame: dict[int, bytes]) -> None:
+        self._frames.append(frame)
+        self._wake.set()
+        self._raise_pending()
+
+    def stop(self) -> None:
+        self._running = False
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._raise_pending()
+
+    def _raise_pending(self) -> None:
+        if not self._errors.empty():
+            raise self._errors.get_nowait()
+
+    def _run(self) -> None:
+        frames = self._frames
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            frame = None
+            while frames:
+                frame = frames.popleft()
+            if frame is not None:
+                try:
+                    self._transport.send_buffers(frame)
+                except Exception as e:  # noqa: BLE001 - handed back via submit()/stop()
+                    self._errors.put(e)
+            if not self._running:
+                return
+
+
 @dataclass
 class DMXEngine:
-    """DMX engine that renders clips and sends DMX via sACN or Art-Net."""
+    """DMX engine that renders clips and sends DMX via sACN or Art-Net.
+
+    render_workers > 1 lets render_layers() render clips on a thread pool. This
+    only pays off when clip rendering releases the GIL (free-threaded Python,
+    or params that call into native code). Pool threads share the unlocked
+    EffectClip._selection_cache and Rig._select_cache, so render_layers()
+    fills them on the calling thread (EffectClip.prepare()) before handing
+    clips to the pool. Custom clips rendered there must not lazily fill shared
+    caches of their own, such as Scene._render_cache via Scene.render().
+    """
 
     rig: Rig | None = None
     protocol: Protocol = Protocol.SACN
     fps: float = 40.0
     universe_ips: dict[int, str] = field(default_factory=dict)
     artnet_target: str = "255.255.255.255"
+    render_workers: int = 0
 
     _fixture_states: dict[Fixture, FixtureState] = field(default_factory=dict, init=False, repr=False)
     _transport: _Transport | None = field(default=None, init=False, repr=False)
+    _send_worker: _SendWorker | None = field(default=None, init=False, repr=False)
+    _render_pool: ThreadPoolExecutor | None = field(default=None, init=False, repr=False)
+    # Encoded output per static Scene: scene -> (color strategy, rig version, frame).
+    # Weakly keyed so scenes the caller drops don't stay alive here.
+    _scene_frames: WeakKeyDictionary[
+        Scene, tuple[ColorStrategy, int, dict[int, dict[int, int]]]
+    ] = field(default_factory=WeakKeyDictionary, init=False, repr=False)
+    # Reusable render_into() output per clip, weakly keyed like _scene_frames
+    _clip_outputs: WeakKeyDictionary[Clip, dict[Fixture, FixtureDelta]] = field(
+        default_factory=WeakKeyDictionary, init=False, repr=False
+    )
+    # Preallocated bytearray(513) per universe, rewritten in place each frame
+    _universe_buffers: dict[int, bytearray] = field(default_factory=dict, init=False, repr=False)
+    # Sorted universes of the rig, recomputed when rig.version changes
+    _universes: list[int] = field(default_factory=lambda: [1], init=False, repr=False)
+    _universes_version: int = field(default=-1, init=False, repr=False)
 
     def __post_init__(self) -> None:
         if self.rig is not None:
@@ -127,6 +239,8 @@ class DMXEngine:
         if self.rig is not None:
             for fixture in self.rig.all:
                 self._fixture_states[fixture] = FixtureState()
+        self._universes_version = -1
+        self._universe_buffers = {u: bytearray(513) for u in self._get_universes()}
 
     def _reset_fixture_states(self) -> None:
         """Clear all fixture states in-place without reallocating."""
@@ -136,14 +250,15 @@ class DMXEngine:
     def set_rig(self, rig: Rig) -> None:
         self.rig = rig
         self._init_fixture_states()
+        self._scene_frames.clear()
+        self._clip_outputs.clear()
 
     def _get_universes(self) -> list[int]:
-        if self.rig is None:
-            return [1]
-        universes = set()
-        for fixture in self.rig.all:
-            universes.add(fixture.universe)
-        return sorted(universes) if universes else [1]
+        rig = self.rig
+        if rig is not None and rig.version != self._universes_version:
+            self._universes = sorted({f.universe for f in rig.all}) or [1]
+            self._universes_version = rig.version
+        return self._universes
 
     def _create_transport(self) -> _Transport:
         universes = self._get_universes()
@@ -154,17 +269,16 @@ class DMXEngine:
                 universes, self.universe_ips, self.artnet_target, self.fps
             )
 
+    def _merge_into_states(self, deltas: dict[Fixture, FixtureDelta]) -> None:
+        apply_deltas_inplace(self._fixture_states, deltas)
+
     def apply_deltas(
         self, deltas: dict[Fixture, FixtureDelta]
     ) -> dict[int, dict[int, int]]:
         """Apply deltas to fixture states and encode to DMX."""
         if self.rig is None:
             return {}
-        for fixture in self.rig.all:
-            if fixture in deltas:
-                self._fixture_states[fixture] = merge_deltas(
-                    [deltas[fixture]], self._fixture_states[fixture]
-                )
+        self._merge_into_states(deltas)
         return self.rig.encode_to_dmx(self._fixture_states)
 
     def start(self) -> None:
@@ -172,24 +286,99 @@ class DMXEngine:
         if self._transport is None:
             self._transport = self._create_transport()
             self._transport.start()
+            self._send_worker = _SendWorker(self._transport)
+            self._send_worker.start()
 
     def stop(self) -> None:
-        """Stop the DMX transport."""
-        if self._transport is not None:
-            self._transport.stop()
-            self._transport = None
+        """Stop the DMX transport.
+
+        Re-raises a send error still pending from the send thread, after
+        everything is shut down.
+        """
+        worker, self._send_worker = self._send_worker, None
+        try:
+            if worker is not None:
+                worker.stop()
+        finally:
+            if self._transport is not None:
+                self._transport.stop()
+                self._transport = None
+            if self._render_pool is not None:
+                self._render_pool.shutdown()
+                self._render_pool = None
 
     def send(self, universe_data: dict[int, dict[int, int]]) -> None:
-        """Send DMX data to the transport."""
-        if self._transport is not None:
-            self._transport.send(universe_data)
+        """Queue DMX data for the send thread.
+
+        Goes through the same worker as send_buffers(), so the transport is
+        only ever driven from one thread. Universes missing from
+        universe_data are sent as all zeros.
+        """
+        if self._send_worker is not None:
+            self._send_worker.submit({
+                u: bytes(1) + _pack_universe(universe_data.get(u))
+                for u in self._get_universes()
+            })
+
+    def _render_clip(self, clip: Clip, rig: Rig, t: float) -> dict[Fixture, FixtureDelta]:
+        render_into = getattr(clip, "render_into", None)
+        if render_into is None:
+            return clip.render(t, rig)
+        # Clips that can render in place reuse one deltas dict across frames.
+        try:
+            out = self._clip_outputs.get(clip)
+            if out is None:
+                out = self._clip_outputs[clip] = {}
+        except TypeError:
+            # Unhashable or not weak-referenceable: render into a fresh dict.
+            out = {}
+        result: dict[Fixture, FixtureDelta] = render_into(t, rig, out)
+        return result
 
     def render_frame(self, clip: Clip, t: float) -> dict[int, dict[int, int]]:
         if self.rig is None:
             return {}
         self._reset_fixture_states()
-        deltas = clip.render(t, self.rig)
-        return self.apply_deltas(deltas)
+        return self.apply_deltas(self._render_clip(clip, self.rig, t))
+
+    def render_frame_buffers(self, clip: Clip, t: float) -> dict[int, bytearray]:
+        """Like render_frame(), but encodes into the engine's universe buffers.
+
+        Skips building the {universe: {channel: value}} dicts; see
+        render_buffers() for the buffer layout and reuse rules.
+        """
+        if self.rig is None:
+            return {}
+        return self.render_buffers(self._render_clip(clip, self.rig, t))
+
+    def render_layers(self, clips: Sequence[Clip], t: float) -> dict[int, dict[int, int]]:
+        """Render several clips at t and blend them in order, later clips on top.
+
+        Clips whose duration has ended by t are skipped without rendering.
+        Rendering is independent per clip, so with render_workers > 1 it runs
+        on a thread pool; blending into fixture states stays sequential.
+        """
+        rig = self.rig
+        if rig is None:
+            return {}
+        self._reset_fixture_states()
+        clips = [c for c in clips if c.duration is None or t <= c.duration]
+        if self.render_workers > 1 and len(clips) > 1:
+            if self._render_pool is None:
+                self._render_pool = ThreadPoolExecutor(
+                    self.render_workers, thread_name_prefix="dmxld-render"
+                )
+            for clip in clips:
+                prepare = getattr(clip, "prepare", None)
+                if prepare is not None:
+                    prepare(rig)
+            # Fresh render() output per clip: the same clip may appear twice.
+            layers = list(self._render_pool.map(lambda c: c.render(t, rig), clips))
+        else:
+            layers = [self._render_clip(clip, rig, t) for clip in clips]
+        for deltas in layers:
+            self._merge_into_states(deltas)
+        return rig.encode_to_dmx(self._fixture_states)
 
     def render_deltas(self, deltas: dict[Fixture, FixtureDelta]) -> dict[int, dict[int, int]]:
         """Reset fixture states, apply deltas, encode to DMX. Use as Runner apply_fn."""
@@ -198,13 +387,48 @@ class DMXEngine:
         self._reset_fixture_states()
         return self.apply_deltas(deltas)
 
+    def render_buffers(self, deltas: dict[Fixture, FixtureDelta]) -> dict[int, bytearray]:
+        """Like render_deltas(), but encodes into the engine's universe buffers.
+
+        Returns {universe_id: bytearray(513)} indexed by DMX channel. The same
+        buffers are reused (and overwritten) on the next call.
+        """
+        if self.rig is None:
+            return {}
+        self._reset_fixture_states()
+        self._merge_into_states(deltas)
+        return self.rig.encode_into_buffers(self._fixture_states, self._universe_buffers)
+
+    def send_buffers(self, buffers: dict[int, bytearray]) -> None:
+        """Queue universe buffers from render_buffers() for the send thread.
+
+        Returns immediately; the buffers are snapshotted, so the caller can
+        render the next frame into them while this one goes out.
+        Raises the error of a failed earlier send, if any; this frame is still
+        queued and sending carries on.
+        """
+        if self._send_worker is not None:
+            self._send_worker.submit({u: bytes(buf) for u, buf in buffers.items()})
+
     def render_scene(self, scene: Scene) -> dict[int, dict[int, int]]:
-        """Render a Scene to DMX data (no time parameter)."""
+        """Render a Scene to DMX data (no time parameter).
+
+        Scenes are static, so the encoded frame is computed once per scene (and
+        color strategy) and copied out on later calls instead of re-encoded.
+        """
         if self.rig is None:
             return {}
         self._reset_fixture_states()
-        deltas = scene.render(self.rig)
-        return self.apply_deltas(deltas)
+        self._merge_into_states(scene.render(self.rig))
+        strategy = get_color_strategy()
+        cached = self._scene_frames.get(scene)
+        version = self.rig.version
+        if cached is None or cached[0] != strategy or cached[1] != version:
+            frame = self.rig.encode_to_dmx(self._fixture_states)
+            self._scene_frames[scene] = (strategy, version, frame)
+        else:
+            frame = cached[2]
+        return {u: dict(channels) for u, channels in frame.items()}
 
     def show(self, scene: Scene) -> None:
         """Render a scene and immediately send it."""
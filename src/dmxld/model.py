@@ -2,26 +2,42 @@
 
 from __future__ import annotations
 
+import sys
+from bisect import bisect_right, insort
 from dataclasses import dataclass, field
-from typing import Any, Iterator, Protocol
-from weakref import WeakSet
+from functools import lru_cache
+from itertools import count
+from operator import attrgetter
+from typing import Any, Callable, Iterator, Protocol, cast
+from weakref import WeakKeyDictionary, WeakSet
 
 from dmxld.color import Raw
 
 
 def _resolve_color_value(color_value: object, attr: Attribute) -> tuple[float, ...]:
     """Resolve a color value, applying conversion unless Raw() wrapped."""
-    if color_value is None:
-        return attr.default_value
-    if isinstance(color_value, dict):
-        return attr.default_value
+    if color_value is None or isinstance(color_value, dict):
+        default: tuple[float, ...] = attr.default_value
+        return default
     if isinstance(color_value, Raw):
         return tuple(color_value)
-    if hasattr(attr, "convert"):
-        boost = getattr(color_value, 'boost', 0.0)
-        return attr.convert(color_value, boost=boost)
-    return color_value
+    convert = getattr(attr, "convert", None)
+    if convert is not None:
+        converted: tuple[float, ...] = convert(
+            color_value, boost=getattr(color_value, "boost", 0.0)
+        )
+        return converted
+    return cast("tuple[float, ...]", color_value)
+
+
+@lru_cache(maxsize=None)
+def color_segment_keys(segments: int) -> tuple[str, ...]:
+    """Interned per-segment color keys: ("color_0", "color_1", ...)."""
+    return tuple(sys.intern(f"color_{seg}") for seg in range(segments))
+
 
+# Start code slot plus 512 channels.
+_BLANK_UNIVERSE = bytes(513)
 
 
 class FixtureGroup:
@@ -53,18 +69,22 @@ class FixtureGroup:
     def __init__(self, group: str | None = None) -> None:
         self.group = group
         self._fixtures: WeakSet[Fixture] = WeakSet()
-        self._cached_list: list[Fixture] | None = None
+        self._cached: tuple[Fixture, ...] | None = None
 
     def _add(self, fixture: Fixture) -> None:
         """Register a fixture with this group (called from Fixture.__post_init__)."""
         self._fixtures.add(fixture)
-        self._cached_list = None
+        self._cached = None
 
-    def __call__(self, rig: Rig | None = None) -> list[Fixture]:
-        """Return fixtures in this group (Selector protocol)."""
-        if self._cached_list is None:
-            self._cached_list = list(self._fixtures)
-        return self._cached_list
+    def __call__(self, rig: Rig | None = None) -> tuple[Fixture, ...]:
+        """Return fixtures in this group (Selector protocol).
+
+        The snapshot is an immutable tuple in fixture creation order, shared
+        between calls and rebuilt only when a fixture is added.
+        """
+        if self._cached is None:
+            self._cached = tuple(sorted(self._fixtures, key=_creation_order))
+        return self._cached
 
     def __iter__(self) -> Iterator[Fixture]:
         """Iterate over fixtures in this group."""
@@ -82,13 +102,13 @@ class FixtureGroup:
     def __or__(self, other: FixtureGroup | Fixture) -> FixtureGroup:
         """Union of two groups."""
         result = FixtureGroup()
-        result._fixtures.update(self._fixtures | self._coerce(other)._fixtures)
+        result._fixtures = self._fixtures | self._coerce(other)._fixtures
         return result
 
     def __and__(self, other: FixtureGroup | Fixture) -> FixtureGroup:
         """Intersection of two groups."""
         result = FixtureGroup()
-        result._fixtures.update(self._fixtures & self._coerce(other)._fixtures)
+        result._fixtures = self._fixtures & self._coerce(other)._fixtures
         return result
 
     def __add__(self, other: FixtureGroup | Fixture) -> FixtureGroup:
@@ -98,13 +118,13 @@ class FixtureGroup:
     def __sub__(self, other: FixtureGroup | Fixture) -> FixtureGroup:
         """Difference of two groups (fixtures in self but not in other)."""
         result = FixtureGroup()
-        result._fixtures.update(self._fixtures - self._coerce(other)._fixtures)
+        result._fixtures = self._fixtures - self._coerce(other)._fixtures
         return result
 
     def __xor__(self, other: FixtureGroup | Fixture) -> FixtureGroup:
         """Symmetric difference (fixtures in either but not both)."""
         result = FixtureGroup()
-        result._fixtures.update(self._fixtures ^ self._coerce(other)._fixtures)
+        result._fixtures = self._fixtures ^ self._coerce(other)._fixtures
         return result
 
     def __contains__(self, fixture: Fixture) -> bool:
@@ -129,7 +149,7 @@ class Attribute(Protocol):
     def encode(self, value: Any) -> list[int]: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Vec3:
     """3D position vector."""
 
@@ -141,6 +161,8 @@ class Vec3:
 class FixtureState(dict[str, Any]):
     """Fixture state. Just a dict with keyword constructor."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(kwargs)
 
@@ -164,6 +186,31 @@ class FixtureType:
         self.channel_count = sum(attr.channel_count for attr in attributes)
         self.default_groups = groups or set()
 
+        # Channel layout is fixed once the type exists: precompute each
+        # attribute's offset and segment geometry so encode() doesn't re-derive it.
+        layout = []
+        offset = 0
+        for attr in attributes:
+            segments = getattr(attr, "segments", 1)
+            layout.append((attr, offset, segments, attr.channel_count // segments))
+            offset += attr.channel_count
+        self._layout: tuple[tuple[Attribute, int, int, int], ...] = tuple(layout)
+        self.segment_count: int = max(
+            (segments for _, _, segments, _ in layout), default=1
+        )
+        # Per-segment color keys, shared so renders never format "color_N".
+        self.color_keys: tuple[str, ...] = color_segment_keys(self.segment_count)
+        self._encoder = _compile_encoder(self._layout)
+
+    @property
+    def compiled_encoder(self) -> Callable[[FixtureState, bytearray, int], None] | None:
+        """Layout-specialized encode_into(), or None for custom attributes.
+
+        When present it writes every channel of the type, so callers can treat
+        the fixture's channel range as fully covered.
+        """
+        return self._encoder
+
     def __call__(
         self,
         universe: int,
@@ -193,31 +240,35 @@ class FixtureType:
         - color_N keys (e.g., color_0, color_1) for per-segment values
         - color key applies same value to all segments
         """
+        if self._encoder is not None:
+            # The compiled encoder writes every channel of the layout.
+            buf = bytearray(self.channel_count)
+            self._encoder(state, buf, 0)
+            return dict(enumerate(buf))
+        return self._encode_generic(state)
+
+    def _encode_generic(self, state: FixtureState) -> dict[int, int]:
+        """Attribute-by-attribute encode(), for layouts without a compiled encoder."""
         result: dict[int, int] = {}
-        offset = 0
-
-        for attr in self.attributes:
-            segments = getattr(attr, "segments", 1)
 
+        for attr, offset, segments, base_channels in self._layout:
             if segments > 1 and attr.name == "color":
                 # Segmented color attribute
-                base_channels = attr.channel_count // segments
-                for seg in range(segments):
-                    seg_key = f"color_{seg}"
-                    color_value = state.get(seg_key) or state.get("color")
+                base_color = state.get("color")
+                for seg, seg_key in enumerate(color_segment_keys(segments)):
+                    color_value = state.get(seg_key) or base_color
                     value = _resolve_color_value(color_value, attr)
 
                     dmx_bytes = attr.encode(value)
+                    seg_offset = offset + seg * base_channels
                     for i, byte in enumerate(dmx_bytes[:base_channels]):
-                        result[offset + i] = byte
-                    offset += base_channels
+                        result[seg_offset + i] = byte
 
             elif attr.name == "color":
                 value = _resolve_color_value(state.get("color"), attr)
                 dmx_bytes = attr.encode(value)
                 for i, byte in enumerate(dmx_bytes):
                     result[offset + i] = byte
-                offset += attr.channel_count
 
             else:
                 # Non-color attribute
@@ -225,12 +276,121 @@ class FixtureType:
                 dmx_bytes = attr.encode(value)
                 for i, byte in enumerate(dmx_bytes):
                     result[offset + i] = byte
-                offset += attr.channel_count
 
         return result
 
+    def encode_into(self, state: FixtureState, buf: bytearray, offset: int) -> None:
+        """Encode state directly into buf starting at offset.
 
-@dataclass
+        Same resolution rules as encode(), but writes bytes in place instead of
+        building a dict. Channels an attribute does not produce are left as-is.
+        """
+        if self._encoder is not None:
+            self._encoder(state, buf, offset)
+            return
+        for attr, attr_offset, segments, base_channels in self._layout:
+            pos = offset + attr_offset
+            if segments > 1 and attr.name == "color":
+                base_color = state.get("color")
+                for seg_key in color_segment_keys(segments):
+                    color_value = state.get(seg_key) or base_color
+                    value = _resolve_color_value(color_value, attr)
+                    _encode_attr_into(attr, value, buf, pos, base_channels)
+                    pos += base_channels
+            elif attr.name == "color":
+                value = _resolve_color_value(state.get("color"), attr)
+                _encode_attr_into(attr, value, buf, pos, attr.channel_count)
+            else:
+                value = state.get(attr.name, attr.default_value)
+                _encode_attr_into(attr, value, buf, pos, attr.channel_count)
+
+
+def _compile_encoder(
+    layout: tuple[tuple[Attribute, int, int, int], ...],
+) -> Callable[[FixtureState, bytearray, int], None] | None:
+    """Generate an encode_into() specialized for a fixed attribute layout.
+
+    The generated function inlines every channel offset and 8-bit quantize, so
+    encoding skips the per-attribute loop and dispatch. Segmented color
+    attributes are unrolled per segment. Only built-in attributes are
+    specialized; anything else returns None and FixtureType falls back to the
+    generic loop.
+    """
+    from dmxld.attributes import (
+        _TO_DMX_EXPR,
+        DimmerAttr,
+        GoboAttr,
+        PanAttr,
+        RGBAttr,
+        RGBAAttr,
+        RGBAWAttr,
+        RGBWAttr,
+        SkipAttr,
+        StrobeAttr,
+        TiltAttr,
+    )
+
+    scalar_attrs = (DimmerAttr, StrobeAttr, GoboAttr, PanAttr, TiltAttr)
+    color_attrs = (RGBAttr, RGBWAttr, RGBAAttr, RGBAWAttr)
+    namespace: dict[str, Any] = {"_resolve_color_value": _resolve_color_value}
+    lines = ["def encode_into(state, buf, off):", "    get = state.get"]
+    for i, (attr, offset, segments, base_channels) in enumerate(layout):
+        kind: type = type(attr)
+        namespace[f"a{i}"] = attr
+        namespace[f"d{i}"] = attr.default_value
+        if segments > 1:
+            if kind not in color_attrs or attr.name != "color":
+                return None
+            lines.append("    base = get('color')")
+            for seg, key in enumerate(color_segment_keys(segments)):
+                pos = offset + seg * base_channels
+                lines.append(
+                    f"    a{i}.encode_into("
+                    f"_resolve_color_value(get({key!r}) or base, a{i}), buf, off + {pos})"
+                )
+        elif kind in scalar_attrs and attr.name != "color":
+            if getattr(attr, "fine", False):
+                lines.append(
+                    f"    a{i}.encode_into(get({attr.name!r}, d{i}), buf, off + {offset})"
+                )
+            else:
+                lines.append(f"    v = get({attr.name!r}, d{i})")
+                lines.append(f"    buf[off + {offset}] = {_TO_DMX_EXPR}")
+        elif kind in color_attrs and attr.name == "color":
+            lines.append(
+                f"    a{i}.encode_into("
+                f"_resolve_color_value(get('color'), a{i}), buf, off + {offset})"
+            )
+        elif kind is SkipAttr:
+            end = offset + attr.channel_count
+            lines.append(f"    buf[off + {offset}:off + {end}] = bytes({attr.channel_count})")
+        else:
+            return None
+    exec("\n".join(lines), namespace)
+    encoder: Callable[[FixtureState, bytearray, int], None] = namespace["encode_into"]
+    return encoder
+
+
+def _encode_attr_into(
+    attr: Attribute, value: Any, buf: bytearray, pos: int, size: int
+) -> None:
+    """Write one attribute's bytes, falling back to encode() for custom attributes."""
+    encode_into = getattr(attr, "encode_into", None)
+    if encode_into is not None:
+        encode_into(value, buf, pos)
+    else:
+        data = attr.encode(value)[:size]
+        buf[pos:pos + len(data)] = bytes(data)
+
+
+# Creation sequence, so groups (unordered weak sets) iterate deterministically.
+_fixture_counter = count()
+_creation_order = attrgetter("_order")
+
+
+# eq=False keeps object identity semantics with C-level __hash__/__eq__, which
+# matters because fixtures key every per-frame dict.
+@dataclass(eq=False)
 class Fixture:
     """A single fixture in the rig."""
 
@@ -240,19 +400,51 @@ class Fixture:
     pos: Vec3 = field(default_factory=Vec3)
     groups: set[FixtureGroup] = field(default_factory=set)
     meta: dict[str, object] = field(default_factory=dict)
-
     def __post_init__(self) -> None:
         """Register this fixture with its groups."""
+        # Creation order for group iteration; a plain attribute rather than a
+        # field so fields(), asdict() and replace() don't see it.
+        self._order = next(_fixture_counter)
         for group in self.groups:
             group._add(self)
+        # Rigs this fixture was added to, re-planned when it is re-patched.
+        self._rigs: WeakSet[Rig] = WeakSet()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        rigs = self.__dict__.get("_rigs")
+        if not rigs or name not in ("universe", "address"):
+            object.__setattr__(self, name, value)
+            return
+        old_universe, old_address = self.universe, self.address
+        universe = value if name == "universe" else old_universe
+        address = value if name == "address" else old_address
+        for rig in rigs:
+            rig._check_move(self, universe, address)
+        object.__setattr__(self, name, value)
+        for rig in rigs:
+            rig._replan(self, old_universe, old_address)
 
     @property
     def segment_count(self) -> int:
         """Max segments across all segmented attributes."""
-        return max(
-            (getattr(attr, "segments", 1) for attr in self.fixture_type.attributes),
-            default=1,
-        )
+        return self.fixture_type.segment_count
+
+    def encode_into(self, state: FixtureState, buf: bytearray) -> None:
+        """Encode state into a universe buffer indexed by DMX channel.
+
+        buf[ch] holds channel ch (1-512); index 0 is the start code slot.
+        Channels that fall outside the buffer are dropped.
+        """
+        size = self.fixture_type.channel_count
+        if self.address >= 1 and self.address + size <= len(buf):
+            self.fixture_type.encode_into(state, buf, self.address)
+            return
+        scratch = bytearray(size)
+        self.fixture_type.encode_into(state, scratch, 0)
+        for i, byte in enumerate(scratch):
+            channel = self.address + i
+            if 1 <= channel < len(buf):
+                buf[channel] = byte
 
     def _as_group(self) -> FixtureGroup:
         """Create a FixtureGroup containing just this fixture."""
@@ -284,46 +476,117 @@ class Fixture:
     def __xor__(self, other: Fixture | FixtureGroup) -> FixtureGroup:
         return self._as_group() ^ other
 
-    def __hash__(self) -> int:
-        return id(self)
-
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Fixture):
-            return NotImplemented
-        return self is other
-
 
 class Rig:
     """Collection of fixtures with lookup helpers."""
 
     def __init__(self, fixtures: list[Fixture] | None = None):
         self._fixtures: list[Fixture] = []
+        # Weakly keyed: a predicate created per call must not pin an entry here.
+        self._select_cache: WeakKeyDictionary[
+            Callable[[Fixture], bool], tuple[Fixture, ...]
+        ] = WeakKeyDictionary()
+        # Per fixture: (universe, type encoder, first channel, end channel,
+        # absolute channels), built at add() and rebuilt when the fixture is
+        # re-patched, so encoding a frame needs no per-fixture setup. The channel range is only set when the type has a
+        # compiled encoder (every channel written) and fits within 1-512.
+        self._encode_plan: dict[
+            Fixture,
+            tuple[int, Callable[[FixtureState, bytearray, int], None], int, int, range | None],
+        ] = {}
+        # Sorted (first channel, last channel) per universe, for _check_overlap()
+        self._intervals: dict[int, list[tuple[int, int]]] = {}
+        # Bumped on every mutation so per-rig caches elsewhere can detect staleness.
+        self.version = 0
         for f in fixtures or []:
-            self._check_overlap(f)
-            self._fixtures.append(f)
-
-    def _check_overlap(self, new_fixture: Fixture) -> None:
-        """Raise ValueError if new_fixture overlaps with existing fixtures."""
-        new_start = new_fixture.address
-        new_end = new_fixture.address + new_fixture.fixture_type.channel_count - 1
-
-        for existing in self._fixtures:
-            if existing.universe != new_fixture.universe:
-                continue
-            existing_start = existing.address
-            existing_end = existing.address + existing.fixture_type.channel_count - 1
-
-            # Check for overlap: ranges overlap if one starts before the other ends
-            if new_start <= existing_end and existing_start <= new_end:
-                raise ValueError(
-                    f"Fixture at universe {new_fixture.universe} address {new_fixture.address} "
-                    f"(channels {new_start}-{new_end}) overlaps with existing fixture "
-                    f"at address {existing.address} (channels {existing_start}-{existing_end})"
-                )
+            self.add(f)
+
+    def _check_overlap(self, universe: int, start: int, channel_count: int) -> None:
+        """Raise ValueError if channels start.. in universe overlap a fixture."""
+        new_start = start
+        new_end = start + channel_count - 1
+
+        # Existing ranges in a universe never overlap, so only the range with
+        # the last start at or before new_end can reach back into the new one.
+        intervals = self._intervals.get(universe)
+        if not intervals:
+            return
+        idx = bisect_right(intervals, (new_end, sys.maxsize))
+        if idx == 0:
+            return
+        existing_start, existing_end = intervals[idx - 1]
+
+        # Check for overlap: ranges overlap if one starts before the other ends
+        if new_start <= existing_end:
+            raise ValueError(
+                f"Fixture at universe {universe} address {start} "
+                f"(channels {new_start}-{new_end}) overlaps with existing fixture "
+                f"at address {existing_start} (channels {existing_start}-{existing_end})"
+            )
+
+    def _plan(self, fixture: Fixture) -> None:
+        """Record fixture's channel interval and encode plan entry."""
+        fixture_type = fixture.fixture_type
+        encoder = fixture_type.compiled_encoder
+        end = fixture.address + fixture_type.channel_count
+        insort(self._intervals.setdefault(fixture.universe, []), (fixture.address, end - 1))
+        dense = encoder is not None and fixture.address >= 1 and end <= 513
+        self._encode_plan[fixture] = (
+            fixture.universe,
+            encoder or fixture_type.encode_into,
+            fixture.address,
+            end,
+            range(fixture.address, end) if dense else None,
+        )
+        self._select_cache.clear()
+        self.version += 1
+
+    def _check_move(self, fixture: Fixture, universe: int, address: int) -> None:
+        """Raise ValueError if fixture can't be re-patched to universe/address."""
+        intervals = self._intervals[fixture.universe]
+        own = (fixture.address, fixture.address + fixture.fixture_type.channel_count - 1)
+        intervals.remove(own)
+        try:
+            self._check_overlap(universe, address, fixture.fixture_type.channel_count)
+        finally:
+            insort(intervals, own)
+
+    def _replan(self, fixture: Fixture, old_universe: int, old_address: int) -> None:
+        """Move fixture's interval and plan entry after a universe/address change."""
+        old_end = old_address + fixture.fixture_type.channel_count - 1
+        self._intervals[old_universe].remove((old_address, old_end))
+        self._plan(fixture)
 
     def add(self, fixture: Fixture) -> None:
-        self._check_overlap(fixture)
+        self._check_overlap(
+            fixture.universe, fixture.address, fixture.fixture_type.channel_count
+        )
         self._fixtures.append(fixture)
+        fixture._rigs.add(self)
+        self._plan(fixture)
+
+    def __len__(self) -> int:
+        return len(self._fixtures)
+
+    def select(self, predicate: Callable[[Fixture], bool]) -> tuple[Fixture, ...]:
+        """Fixtures matching predicate, memoized per predicate object.
+
+        The result is cached until the rig changes, so predicates should only
+        read static fixture data (position, type, meta). Reuse the same
+        predicate object to hit the cache:
+
+            left_side = lambda f: f.pos.x < 0
+            Scene(selector=lambda r: r.select(left_side), ...)
+        """
+        try:
+            selected = self._select_cache.get(predicate)
+        except TypeError:
+            # Not weak-referenceable: filter without caching.
+            return tuple(f for f in self._fixtures if predicate(f))
+        if selected is None:
+            selected = tuple(f for f in self._fixtures if predicate(f))
+            self._select_cache[predicate] = selected
+        return selected
 
     @property
     def all(self) -> list[Fixture]:
@@ -334,11 +597,47 @@ class Rig:
     ) -> dict[int, dict[int, int]]:
         """Returns {universe_id: {channel: value}}"""
         universes: dict[int, dict[int, int]] = {}
+        plan = self._encode_plan
         for fixture, state in states.items():
-            universe_data = universes.setdefault(fixture.universe, {})
+            universe_data = universes.get(fixture.universe)
+            if universe_data is None:
+                universe_data = universes[fixture.universe] = {}
+            entry = plan.get(fixture)
+            if entry is not None and entry[4] is not None:
+                channels = entry[4]
+                scratch = bytearray(len(channels))
+                entry[1](state, scratch, 0)
+                universe_data.update(zip(channels, scratch))
+                continue
             channel_values = fixture.fixture_type.encode(state)
             for offset, value in channel_values.items():
                 channel = fixture.address + offset
                 if 1 <= channel <= 512:
                     universe_data[channel] = value
         return universes
+
+    def encode_into_buffers(
+        self,
+        states: dict[Fixture, FixtureState],
+        buffers: dict[int, bytearray],
+    ) -> dict[int, bytearray]:
+        """Encode states into reusable per-universe buffers, returning buffers.
+
+        Each buffer is a bytearray(513) indexed by DMX channel (slot 0 is the
+        start code). Existing buffers are zeroed and rewritten in place; a
+        buffer is allocated only the first time a universe is seen.
+        """
+        for buf in buffers.values():
+            buf[:] = _BLANK_UNIVERSE
+        plan = self._encode_plan
+        for fixture, state in states.items():
+            entry = plan.get(fixture)
+            universe = entry[0] if entry is not None else fixture.universe
+            target = buffers.get(universe)
+            if target is None:
+                target = buffers[universe] = bytearray(_BLANK_UNIVERSE)
+            if entry is not None and entry[2] >= 1 and entry[3] <= len(target):
+                entry[1](state, target, entry[2])
+            else:
+                fixture.encode_into(state, target)
+        return buffers
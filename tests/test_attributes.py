@@ -9,6 +9,8 @@ from dmxld.attributes import (
     RGBAAttr,
     RGBAWAttr,
     PanAttr,
+    StrobeAttr,
+    GoboAttr,
     SkipAttr,
 )
 from dmxld.color import Color
@@ -108,6 +110,70 @@ class TestPanTiltAttr:
         assert attr.channel_count == 2
         assert attr.default_value == 0.5
 
+class TestEncodeInto:
+    """encode_into() writes the same bytes as encode() into a shared buffer."""
+
+    @pytest.mark.parametrize("attr,value", [
+        (DimmerAttr(), 0.5),
+        (DimmerAttr(fine=True), 0.5),
+        (PanAttr(), 0.25),
+        (PanAttr(fine=True), 0.7),
+        (RGBAttr(), (1.0, 0.5, 0.0)),
+        (RGBWAttr(), (1.0, 0.5, 0.0, 0.25)),
+        (RGBAAttr(), (1.0, 0.5, 0.0, 0.25)),
+        (RGBAWAttr(), (1.0, 0.5, 0.0, 0.25, 0.1)),
+        (StrobeAttr(), 0.3),
+        (GoboAttr(), 0.6),
+        (SkipAttr(count=2), None),
+    ])
+    def test_matches_encode(self, attr, value) -> None:
+        buf = bytearray(16)
+        attr.encode_into(value, buf, 3)
+        n = attr.channel_count
+        assert list(buf[3:3 + n]) == attr.encode(value)
+        assert buf[:3] == bytearray(3)
+        assert buf[3 + n:] == bytearray(13 - n)
+
+    def test_16bit_clamps_out_of_range(self) -> None:
+        buf = bytearray(4)
+        PanAttr(fine=True).encode_into(-0.5, buf, 0)
+        PanAttr(fine=True).encode_into(1.5, buf, 2)
+        assert list(buf) == [0, 0, 255, 255]
+
+    def test_clamps_out_of_range(self) -> None:
+        buf = bytearray(3)
+        RGBAttr().encode_into((1.5, -0.2, 0.5), buf, 0)
+        assert list(buf) == [255, 0, 127]
+
+    def test_list_and_tuple_color_encode_alike(self) -> None:
+        buf = bytearray(8)
+        RGBWAttr().encode_into([0.2, 0.4, 0.6, 0.8], buf, 0)
+        RGBWAttr().encode_into((0.2, 0.4, 0.6, 0.8), buf, 4)
+        assert buf[:4] == buf[4:] == bytes([51, 102, 153, 204])
+
+
+class TestConvertCache:
+    def test_repeated_convert_hits_cache(self) -> None:
+        from dmxld.attributes import _rgb_to_rgbw_cached
+        attr = RGBWAttr(strategy="balanced")
+        first = attr.convert((0.9, 0.7, 0.3))
+        hits = _rgb_to_rgbw_cached.cache_info().hits
+        assert attr.convert((0.9, 0.7, 0.3)) == first
+        assert _rgb_to_rgbw_cached.cache_info().hits == hits + 1
+
+    def test_global_strategy_change_not_masked_by_cache(self) -> None:
+        from dmxld.color import set_color_strategy
+        attr = RGBWAttr()
+        try:
+            set_color_strategy("balanced")
+            balanced = attr.convert((1.0, 1.0, 1.0))
+            set_color_strategy("preserve_rgb")
+            preserved = attr.convert((1.0, 1.0, 1.0))
+        finally:
+            set_color_strategy("balanced")
+        assert balanced == (0.0, 0.0, 0.0, 1.0)
+        assert preserved == (1.0, 1.0, 1.0, 0.0)
+
 
 class TestSkipAttr:
     def test_unique_names(self) -> None:
@@ -30,6 +30,35 @@ class TestBlendOps:
         assert result == pytest.approx((0.5, 0.4, 0.3))
 
 
+    def test_apply_delta_leaves_input_untouched(self) -> None:
+        state = FixtureState(dimmer=0.5)
+        apply_delta(state, FixtureDelta(dimmer=(BlendOp.SET, 0.8)))
+        assert state["dimmer"] == 0.5
+
+    def test_apply_delta_inplace_mutates(self) -> None:
+        from dmxld.blend import apply_delta_inplace
+        state = FixtureState(dimmer=0.8)
+        result = apply_delta_inplace(state, FixtureDelta(dimmer=(BlendOp.MUL, 0.5)))
+        assert result is state
+        assert state["dimmer"] == pytest.approx(0.4)
+
+    def test_apply_deltas_inplace_over_states(self) -> None:
+        from dmxld.blend import apply_deltas_inplace
+        from dmxld.model import Fixture, FixtureType
+        from dmxld.attributes import DimmerAttr
+
+        a, b, stray = (Fixture(FixtureType(DimmerAttr()), 1, n) for n in (1, 2, 3))
+        states = {a: FixtureState(dimmer=0.8), b: FixtureState()}
+        apply_deltas_inplace(states, {
+            a: FixtureDelta(dimmer=(BlendOp.MUL, 0.5)),
+            b: FixtureDelta(dimmer=(BlendOp.SET, 1.0)),
+            stray: FixtureDelta(dimmer=(BlendOp.SET, 1.0)),
+        })
+        assert states[a]["dimmer"] == pytest.approx(0.4)
+        assert states[b]["dimmer"] == 1.0
+        assert stray not in states
+
+
 class TestClamping:
     def test_clamps_to_range(self) -> None:
         state = FixtureState(dimmer=0.8)
@@ -61,6 +90,7 @@ class TestMergeDeltas:
         delta = FixtureDelta(dimmer=(BlendOp.MUL, 0.5))
         result = merge_deltas([delta], initial)
         assert result["dimmer"] == pytest.approx(0.4)
+        assert initial["dimmer"] == 0.8
 
 
 class TestFixtureDeltaScale:
@@ -117,6 +147,13 @@ class TestListValueHandling:
         result = _apply_op((0.5, 0.5, 0.5), BlendOp.ADD_CLAMP, [0.3, 0.3, 0.3])
         assert result == pytest.approx((0.8, 0.8, 0.8))
 
+    def test_apply_op_tuple_subclass(self) -> None:
+        """Tuple subclasses without a dispatch entry take the isinstance path."""
+        from dmxld.blend import _apply_op
+        from dmxld.color import Raw
+        result = _apply_op((0.2, 0.2, 0.2), BlendOp.ADD_CLAMP, Raw(0.3, 0.3, 0.3))
+        assert result == pytest.approx((0.5, 0.5, 0.5))
+
     def test_scale_list_value(self) -> None:
         delta = FixtureDelta()
         delta["color"] = (BlendOp.SET, [1.0, 0.8, 0.6])
@@ -217,6 +254,12 @@ class TestColorBoostScaling:
         # boost=0 * 0.5 = 0, so Color is created but boost stays 0
         assert result.boost == 0.0
 
+    def test_from_values_matches_constructor(self) -> None:
+        fast = Color._from_values([0.1, 0.2, 0.3], 0.4)
+        assert isinstance(fast, Color)
+        assert fast == Color(0.1, 0.2, 0.3, boost=0.4)
+        assert fast.boost == 0.4
+
 
 class TestComposeAdd:
     def test_different_attributes_merged(self) -> None:
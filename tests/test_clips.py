@@ -4,7 +4,7 @@ import pytest
 
 from dmxld.attributes import DimmerAttr, RGBAttr, RGBWAttr
 from dmxld.blend import BlendOp
-from dmxld.clips import EffectClip, Scene, fade
+from dmxld.clips import EffectClip, Scene, fade, fade_batch
 from dmxld.model import Fixture, FixtureState, FixtureType, Rig, Vec3
 
 
@@ -65,6 +65,25 @@ class TestScene:
         assert scene_set.render(rig)[rig.all[0]]["dimmer"][0] == BlendOp.SET
         assert scene_mul.render(rig)[rig.all[0]]["dimmer"][0] == BlendOp.MUL
 
+    def test_render_cached_per_rig(self, rig: Rig, multi_rig: Rig) -> None:
+        scene = Scene(
+            selector=lambda r: r.all,
+            params=lambda f: FixtureState(dimmer=1.0),
+        )
+        first = scene.render(rig)
+        assert scene.render(rig) is first
+        assert set(scene.render(multi_rig)) == set(multi_rig.all)
+        assert set(scene.render(rig)) == set(rig.all)
+
+    def test_render_cache_invalidated_by_rig_add(self, rig: Rig) -> None:
+        scene = Scene(
+            selector=lambda r: r.all,
+            params=lambda f: FixtureState(dimmer=1.0),
+        )
+        assert len(scene.render(rig)) == 1
+        rig.add(Fixture(DimmerOnly, universe=1, address=2))
+        assert len(scene.render(rig)) == 2
+
 
 class TestSceneLayers:
     """Scene with multi-layer support."""
@@ -127,6 +146,21 @@ class TestSceneLayers:
             assert deltas[f]["dimmer"][1] == pytest.approx(1.0)
             assert deltas[f]["color"][1] == (1.0, 0.0, 0.0)
 
+    def test_static_layer_shares_delta_without_leaking(self, two_group_rig: Rig) -> None:
+        scene = Scene(
+            layers=[
+                (lambda r: r.all, FixtureState(dimmer=1.0)),
+                (self.back, lambda f: FixtureState(color=(0.0, 0.0, 1.0))),
+            ],
+        )
+        deltas = scene.render(two_group_rig)
+        front = list(self.front)
+        back = next(iter(self.back))
+        assert deltas[front[0]] is deltas[front[1]]
+        assert "color" not in deltas[front[0]]
+        assert deltas[back]["color"][1] == (0.0, 0.0, 1.0)
+        assert deltas[back]["dimmer"][1] == pytest.approx(1.0)
+
     def test_layers_with_callable_params(self, two_group_rig: Rig) -> None:
         """Layers accept callable params."""
         scene = Scene(
@@ -162,6 +196,17 @@ class TestSceneLayers:
 
 
 class TestFade:
+    @pytest.mark.parametrize("duration,fade_in,fade_out", [
+        (10.0, 2.0, 3.0),
+        (10.0, 0.0, 0.0),
+        (None, 2.0, 3.0),
+        (4.0, 3.0, 3.0),
+    ])
+    def test_batch_matches_scalar(self, duration, fade_in, fade_out) -> None:
+        ts = [i * 0.25 for i in range(-4, 48)]
+        expected = [fade(t, duration, fade_in, fade_out) for t in ts]
+        assert fade_batch(ts, duration, fade_in, fade_out) == pytest.approx(expected)
+
     def test_fade_in_ramp(self) -> None:
         assert fade(0.0, 10.0, 2.0, 0.0) == pytest.approx(0.0)
         assert fade(1.0, 10.0, 2.0, 0.0) == pytest.approx(0.5)
@@ -178,6 +223,12 @@ class TestFade:
         assert fade(5.0, 10.0, 2.0, 2.0) == pytest.approx(1.0)
         assert fade(9.0, 10.0, 2.0, 2.0) == pytest.approx(0.5)
 
+    def test_overlapping_fades_take_lower_envelope(self) -> None:
+        # 2s clip with 2s fade in and out: no jump where the fade-in ends.
+        assert fade(0.5, 2.0, 2.0, 2.0) == pytest.approx(0.25)
+        assert fade(1.0, 2.0, 2.0, 2.0) == pytest.approx(0.5)
+        assert fade(1.5, 2.0, 2.0, 2.0) == pytest.approx(0.25)
+
     def test_infinite_duration(self) -> None:
         assert fade(0.0, None, 2.0, 2.0) == pytest.approx(0.0)
         assert fade(1.0, None, 2.0, 2.0) == pytest.approx(0.5)
@@ -240,6 +291,100 @@ class TestEffectClip:
         assert len(effect.render(-1.0, multi_rig)) == 0
         assert len(effect.render(10.0, multi_rig)) == 0
 
+    def test_render_into_reuses_deltas(self, multi_rig: Rig) -> None:
+        effect = EffectClip(
+            selector=lambda r: r.all,
+            params=lambda t, f, i, seg: FixtureState(dimmer=t),
+        )
+        out: dict = {}
+        first = effect.render_into(0.25, multi_rig, out)
+        delta = first[multi_rig.all[0]]
+        second = effect.render_into(0.75, multi_rig, out)
+        assert second is out
+        assert second[multi_rig.all[0]] is delta
+        assert delta["dimmer"][1] == pytest.approx(0.75)
+        assert second == effect.render(0.75, multi_rig)
+
+    def test_render_into_drops_unselected(self, rig: Rig, multi_rig: Rig) -> None:
+        effect = EffectClip(
+            selector=lambda r: r.all,
+            params=lambda t, f, i, seg: FixtureState(dimmer=1.0),
+            clip_duration=5.0,
+        )
+        out: dict = {}
+        effect.render_into(0.0, multi_rig, out)
+        effect.render_into(0.0, rig, out)
+        assert set(out) == set(rig.all)
+        assert effect.render_into(6.0, rig, out) == {}
+
+    def test_selector_cached_until_rig_changes(self, multi_rig: Rig) -> None:
+        calls = []
+
+        def selector(r: Rig) -> list[Fixture]:
+            calls.append(r)
+            return r.all
+
+        effect = EffectClip(
+            selector=selector,
+            params=lambda t, f, i, seg: FixtureState(dimmer=1.0),
+        )
+        effect.render(0.0, multi_rig)
+        effect.render(1.0, multi_rig)
+        assert len(calls) == 1
+        multi_rig.add(Fixture(RGBDimmer, universe=1, address=13))
+        assert len(effect.render(2.0, multi_rig)) == 4
+        assert len(calls) == 2
+
+    def test_dimmer_only_skips_params_when_faded_out(self, multi_rig: Rig) -> None:
+        calls = []
+
+        def params(t: float, f: Fixture, i: int, seg: int) -> FixtureState:
+            calls.append(t)
+            return FixtureState(dimmer=1.0)
+
+        effect = EffectClip(
+            selector=lambda r: r.all,
+            params=params,
+            fade_in=1.0,
+            dimmer_only=True,
+        )
+        deltas = effect.render(0.0, multi_rig)
+        assert calls == []
+        assert all(d == {"dimmer": (BlendOp.SET, 0.0)} for d in deltas.values())
+        assert len(deltas) == 3
+
+        effect.blend_op = BlendOp.ADD_CLAMP
+        assert effect.render(0.0, multi_rig) == {}
+        assert effect.render(0.5, multi_rig)[multi_rig.all[0]]["dimmer"][1] == pytest.approx(0.5)
+
+    def test_fade_fields_changed_after_construction(self, multi_rig: Rig) -> None:
+        effect = EffectClip(
+            selector=lambda r: r.all,
+            params=lambda t, f, i, seg: FixtureState(dimmer=1.0),
+        )
+        assert effect.render(1.0, multi_rig)[multi_rig.all[0]]["dimmer"][1] == 1.0
+        effect.fade_in = 2.0
+        assert effect.render(1.0, multi_rig)[multi_rig.all[0]]["dimmer"][1] == pytest.approx(0.5)
+
+    def test_fade_out_without_duration_is_ignored(self, multi_rig: Rig) -> None:
+        effect = EffectClip(
+            selector=lambda r: r.all,
+            params=lambda t, f, i, seg: FixtureState(dimmer=0.8),
+            fade_out=2.0,
+        )
+        deltas = effect.render(100.0, multi_rig)
+        assert all(d["dimmer"][1] == pytest.approx(0.8) for d in deltas.values())
+
+    def test_static_selector_iterated_once(self, multi_rig: Rig) -> None:
+        """A one-shot iterable selector still works on every render."""
+        effect = EffectClip(
+            selector=(f for f in multi_rig.all),
+            params=lambda t, f, i, seg: FixtureState(dimmer=1.0),
+        )
+        assert len(effect.render(0.0, multi_rig)) == 3
+        assert len(effect.render(1.0, multi_rig)) == 3
+        assert len(effect._selection_cache) == 0
+
 
 class TestSegmentedEffectClip:
     """EffectClip with segmented fixtures."""
@@ -33,6 +33,8 @@ class TestColor:
         c = Color(1.0, 0.5)
         assert c.b == 0.0
         assert c.w == 0.0
+        assert c.rgb == (1.0, 0.5, 0.0)
+        assert Color().r == 0.0
 
     def test_rgb_helper(self) -> None:
         c = rgb(1.0, 0.5, 0.0)
@@ -70,6 +72,11 @@ class TestColorHSV:
         assert s == pytest.approx(1.0)
         assert v == pytest.approx(1.0)
 
+    def test_hsv_computed_once(self) -> None:
+        c = Color.from_hsv(0.3, 0.5, 0.8)
+        assert c.hsv is c.hsv
+        assert c.hsv == pytest.approx((0.3, 0.5, 0.8))
+
 
 class TestRGBToRGBW:
     """RGB to RGBW conversion."""
@@ -163,6 +170,11 @@ class TestUnifiedColorKey:
         encoded = ft.encode(state)
         assert (encoded[1], encoded[2], encoded[3], encoded[4]) == (127, 127, 127, 127)
 
+    def test_raw_has_no_instance_dict(self) -> None:
+        from dmxld import Raw
+
+        assert not hasattr(Raw(0.5, 0.5, 0.5), "__dict__")
+
     def test_color_from_hsv(self) -> None:
         from dmxld import FixtureType, DimmerAttr, RGBAttr, FixtureState, Color
 
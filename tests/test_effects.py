@@ -31,12 +31,89 @@ class TestEffectTemplate:
         assert Pulse(rate=3.0).rate == 3.0
         assert Chase(fixture_count=8, speed=2.0).fixture_count == 8
 
+    def test_dimmer_only_passed_to_clip(self) -> None:
+        front = FixtureGroup()
+        assert Pulse()(front).dimmer_only
+        assert not Rainbow()(front).dimmer_only
+
+    def test_dimmer_only_not_inherited_by_render_params_override(self) -> None:
+        from dmxld.color import Color
+        from dmxld.model import FixtureState
+
+        class ColorPulse(Pulse):
+            def render_params(self, t, f, i, seg) -> FixtureState:
+                return FixtureState(dimmer=1.0, color=Color(0.0, 0.0, 1.0))
+
+        f = Fixture(RGBDimmer, 1, 1)
+        clip = ColorPulse()(lambda r: r.all, fade_in=1.0)
+        assert not clip.dimmer_only
+        result = clip.render(0.0, Rig([f]))
+        assert result[f]["dimmer"][1] == 0.0
+        assert result[f]["color"][1] == (0.0, 0.0, 1.0)
+        assert Pulse(rate=2.0).name == "Pulse(rate=2.0)"
+
     def test_name_and_repr(self) -> None:
         effect = Pulse(rate=2.0)
         assert effect.name == "Pulse(rate=2.0)"
         assert repr(effect) == "Pulse(rate=2.0)"
 
 
+class TestRenderBatch:
+    @pytest.mark.parametrize("effect", [
+        Pulse(rate=1.3),
+        Chase(fixture_count=5, speed=0.7, width=1.5),
+        Rainbow(speed=0.3, saturation=0.8),
+        Strobe(rate=3.0, duty=0.4),
+        Wave(speed=0.5, wavelength=3.0),
+        Solid(dimmer=0.6, color=(1.0, 0.5, 0.0)),
+    ], ids=lambda e: type(e).__name__)
+    def test_batch_matches_render_params(self, effect) -> None:
+        fixtures = [Fixture(RGBDimmer, 1, i * 4 + 1) for i in range(5)]
+        rig = Rig(fixtures)
+        clip = effect(lambda r: r.all, duration=10.0, fade_in=2.0)
+        assert clip.params_batch is not None
+        for t in (0.0, 0.37, 1.0, 4.2):
+            batched = clip.render(t, rig)
+            clip.params_batch = None
+            scalar = clip.render(t, rig)
+            clip.params_batch = effect.render_batch
+            for f in fixtures:
+                assert set(batched[f]) == set(scalar[f])
+                for name, (op, value) in scalar[f].items():
+                    assert batched[f][name][0] is op
+                    assert batched[f][name][1] == pytest.approx(value)
+
+    def test_no_batch_without_override(self) -> None:
+        from dmxld.effects import EffectTemplate
+
+        class Custom(EffectTemplate):
+            pass
+
+        assert Custom()(FixtureGroup()).params_batch is None
+
+    def test_subclass_overriding_render_params_gets_no_batch(self) -> None:
+        from dmxld.color import Color
+        from dmxld.model import FixtureState
+
+        class DimRed(Solid):
+            def render_params(self, t, f, i, seg) -> FixtureState:
+                return FixtureState(dimmer=0.25, color=Color(1.0, 0.0, 0.0))
+
+        f = Fixture(RGBDimmer, 1, 1)
+        clip = DimRed()(lambda r: r.all)
+        assert clip.params_batch is None
+        result = clip.render(0.0, Rig([f]))
+        assert result[f]["dimmer"][1] == 0.25
+        assert result[f]["color"][1] == (1.0, 0.0, 0.0)
+
+    def test_segmented_fixtures_use_render_params(self) -> None:
+        bar = FixtureType(DimmerAttr(), RGBAttr(segments=2))
+        f = Fixture(bar, 1, 1)
+        clip = Rainbow(speed=0.0)(lambda r: r.all)
+        result = clip.render(0.0, Rig([f]))
+        assert result[f]["color_0"][1] != result[f]["color_1"][1]
+
+
 class TestBuiltInEffects:
     @pytest.fixture
     def setup(self):
@@ -58,6 +135,17 @@ class TestBuiltInEffects:
         result = clip.render(0.25, rig)
         assert result[fixtures[0]]["dimmer"][1] == pytest.approx(1.0, abs=0.01)
 
+    def test_pulse_tracks_rate_changes(self, setup) -> None:
+        front, fixtures, rig = setup
+        effect = Pulse(rate=1.0)
+        clip = effect(front, duration=10.0)
+        first = clip.render(0.25, rig)
+        assert [d["dimmer"][1] for d in first.values()] == pytest.approx([1.0] * len(fixtures))
+
+        effect.rate = 2.0  # sin(π) = 0 → dimmer = 0.5
+        result = clip.render(0.25, rig)
+        assert result[fixtures[0]]["dimmer"][1] == pytest.approx(0.5)
+
     def test_chase_sequence(self, setup) -> None:
         front, fixtures, rig = setup
         clip = Chase(fixture_count=4, speed=1.0)(front, duration=10.0)
@@ -66,6 +154,14 @@ class TestBuiltInEffects:
         # First fixture should be brightest at t=0
         assert result[fixtures[0]]["dimmer"][1] > result[fixtures[1]]["dimmer"][1]
 
+    def test_chase_wraps_around(self, setup) -> None:
+        front, fixtures, rig = setup
+        clip = Chase(fixture_count=4, speed=1.0, width=2.0)(front, duration=10.0)
+        result = clip.render(0.0, rig)
+
+        dimmers = [result[f]["dimmer"][1] for f in fixtures]
+        assert dimmers == pytest.approx([1.0, 0.5, 0.0, 0.5])
+
     def test_rainbow_color(self) -> None:
         front = FixtureGroup()
         f = Fixture(RGBDimmer, 1, 1, groups={front})
@@ -4,7 +4,7 @@ import pytest
 
 from dmxld.attributes import DimmerAttr, RGBAttr
 from dmxld.blend import BlendOp, FixtureDelta
-from dmxld.clips import Scene
+from dmxld.clips import EffectClip, Scene
 from dmxld.engine import DMXEngine
 from dmxld.model import Fixture, FixtureGroup, FixtureState, FixtureType, Rig
 
@@ -47,6 +47,37 @@ class TestRenderScene:
         assert result[1][10] == 0    # right fixture dark
 
 
+    def test_static_scene_encoded_once(self, monkeypatch) -> None:
+        rig = Rig([Fixture(RGBFixture, universe=1, address=1)])
+        engine = DMXEngine(rig=rig)
+        scene = Scene(selector=rig.all, params=FixtureState(dimmer=0.5))
+
+        calls = []
+        encode = rig.encode_to_dmx
+        monkeypatch.setattr(rig, "encode_to_dmx", lambda s: calls.append(1) or encode(s))
+
+        first = engine.render_scene(scene)
+        first[1][1] = 0  # callers get their own copy
+        second = engine.render_scene(scene)
+        assert second[1][1] == 127
+        assert len(calls) == 1
+
+    def test_scene_cache_respects_color_strategy(self) -> None:
+        from dmxld.attributes import RGBWAttr
+        from dmxld.color import set_color_strategy
+
+        rig = Rig([Fixture(FixtureType(RGBWAttr()), universe=1, address=1)])
+        engine = DMXEngine(rig=rig)
+        scene = Scene(selector=rig.all, params=FixtureState(color=(1.0, 1.0, 1.0)))
+        try:
+            set_color_strategy("balanced")
+            assert engine.render_scene(scene)[1][4] == 255
+            set_color_strategy("preserve_rgb")
+            assert engine.render_scene(scene)[1][4] == 0
+        finally:
+            set_color_strategy("balanced")
+
+
 class TestRenderDeltas:
     def test_applies_deltas(self) -> None:
         rig = Rig([Fixture(RGBFixture, universe=1, address=1)])
@@ -58,6 +89,129 @@ class TestRenderDeltas:
 
         assert result[1][1] == 255  # dimmer
 
+    def test_render_buffers_reuses_universe_buffer(self) -> None:
+        rig = Rig([Fixture(RGBFixture, universe=1, address=1)])
+        engine = DMXEngine(rig=rig)
+        fixture = rig.all[0]
+
+        first = engine.render_buffers({fixture: FixtureDelta(dimmer=(BlendOp.SET, 1.0))})
+        buf = first[1]
+        assert len(buf) == 513
+        assert buf[1] == 255
+
+        second = engine.render_buffers({fixture: FixtureDelta(color=(BlendOp.SET, (1.0, 0.0, 0.0)))})
+        assert second[1] is buf
+        assert list(buf[1:5]) == [0, 255, 0, 0]
+
+
+class TestRenderFrame:
+    def test_effect_frames_reuse_clip_output(self) -> None:
+        rig = Rig([Fixture(RGBFixture, universe=1, address=1)])
+        engine = DMXEngine(rig=rig)
+        effect = EffectClip(
+            selector=lambda r: r.all,
+            params=lambda t, f, i, seg: FixtureState(dimmer=t),
+        )
+        assert engine.render_frame(effect, 0.0)[1][1] == 0
+        state = engine._fixture_states[rig.all[0]]
+        assert engine.render_frame(effect, 1.0)[1][1] == 255
+        assert engine._fixture_states[rig.all[0]] is state
+        assert len(engine._clip_outputs) == 1
+
+    def test_dropped_clips_and_scenes_are_not_kept_alive(self) -> None:
+        import gc
+
+        rig = Rig([Fixture(RGBFixture, universe=1, address=1)])
+        engine = DMXEngine(rig=rig)
+        for _ in range(20):
+            engine.render_frame(
+                EffectClip(selector=lambda r: r.all, params=lambda t, f, i, seg: FixtureState()),
+                0.0,
+            )
+            engine.render_scene(Scene(layers=[(lambda r: r.all, FixtureState(dimmer=1.0))]))
+        gc.collect()
+        assert len(engine._clip_outputs) == 0
+        assert len(engine._scene_frames) == 0
+
+
+    def test_frame_buffers_match_render_frame(self) -> None:
+        rig = Rig([Fixture(RGBFixture, universe=1, address=1)])
+        engine = DMXEngine(rig=rig)
+        effect = EffectClip(
+            selector=lambda r: r.all,
+            params=lambda t, f, i, seg: FixtureState(dimmer=t, color=(0.0, 1.0, 0.0)),
+        )
+        expected = engine.render_frame(effect, 0.5)
+        buffers = engine.render_frame_buffers(effect, 0.5)
+        assert buffers is engine._universe_buffers
+        assert {ch: buffers[1][ch] for ch in expected[1]} == expected[1]
+
+
+class TestRenderLayers:
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_layers_blend_in_order(self, workers: int) -> None:
+        rig = Rig([Fixture(RGBFixture, universe=1, address=1)])
+        engine = DMXEngine(rig=rig, render_workers=workers)
+        base = Scene(selector=lambda r: r.all, params=FixtureState(dimmer=1.0))
+        half = EffectClip(
+            selector=lambda r: r.all,
+            params=lambda t, f, i, seg: FixtureState(dimmer=t),
+            blend_op=BlendOp.MUL,
+        )
+        layers = [_SceneLayer(base), half]
+        try:
+            assert engine.render_layers(layers, 0.5)[1][1] == 127
+            assert engine.render_layers(layers[::-1], 0.5)[1][1] == 255
+        finally:
+            engine.stop()
+        assert engine._render_pool is None
+
+    def test_pool_selections_resolved_on_calling_thread(self) -> None:
+        import threading
+
+        rig = Rig([Fixture(RGBFixture, universe=1, address=1)])
+        engine = DMXEngine(rig=rig, render_workers=2)
+        threads = []
+
+        def selector(r: Rig) -> list[Fixture]:
+            threads.append(threading.current_thread())
+            return r.all
+
+        clips = [
+            EffectClip(selector=selector, params=lambda t, f, i, seg: FixtureState(dimmer=t))
+            for _ in range(2)
+        ]
+        try:
+            engine.render_layers(clips, 0.5)
+        finally:
+            engine.stop()
+        assert threads == [threading.current_thread()] * 2
+
+
+    def test_ended_clips_not_rendered(self) -> None:
+        rig = Rig([Fixture(RGBFixture, universe=1, address=1)])
+        engine = DMXEngine(rig=rig)
+        calls = []
+        short = EffectClip(
+            selector=lambda r: r.all,
+            params=lambda t, f, i, seg: calls.append(t) or FixtureState(dimmer=1.0),
+            clip_duration=1.0,
+        )
+        assert engine.render_layers([short], 0.5)[1][1] == 255
+        assert engine.render_layers([short], 2.0)[1][1] == 0
+        assert calls == [0.5]
+
+
+class _SceneLayer:
+    """Adapts a Scene to the Clip protocol for layering tests."""
+
+    def __init__(self, scene: Scene) -> None:
+        self.scene = scene
+        self.duration = None
+
+    def render(self, t: float, rig: Rig) -> dict[Fixture, FixtureDelta]:
+        return self.scene.render(rig)
+
 
 class TestEngineLifecycle:
     def test_stop_without_start(self) -> None:
@@ -71,3 +225,208 @@ class TestEngineLifecycle:
         rig = Rig([Fixture(RGBFixture, 1, 1)])
         engine.set_rig(rig)
         assert engine.rig is rig
+
+    def test_universes_snapshot_on_set_rig(self) -> None:
+        engine = DMXEngine()
+        assert engine._get_universes() == [1]
+
+        engine.set_rig(Rig([Fixture(RGBFixture, 3, 1), Fixture(RGBFixture, 2, 1)]))
+        assert engine._get_universes() == [2, 3]
+        assert sorted(engine._universe_buffers) == [2, 3]
+
+    def test_universes_follow_fixtures_added_after_set_rig(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import dmxld.engine as engine_mod
+
+        rig = Rig([Fixture(RGBFixture, 1, 1)])
+        engine = DMXEngine()
+        engine.set_rig(rig)
+        assert engine._get_universes() == [1]
+
+        rig.add(Fixture(RGBFixture, 2, 1))
+        assert engine._get_universes() == [1, 2]
+        monkeypatch.setattr(
+            engine_mod, "_SACNTransport", lambda universes, ips, fps: list(universes)
+        )
+        assert engine._create_transport() == [1, 2]
+
+    def test_send_buffers_goes_through_send_thread(self) -> None:
+        import threading
+
+        from dmxld.engine import _Transport
+
+        class RecordingTransport(_Transport):
+            def __init__(self) -> None:
+                self.frames: list[dict[int, bytes]] = []
+                self.sent = threading.Event()
+                self.stopped = False
+
+            def start(self) -> None:
+                pass
+
+            def send(self, universe_data: dict[int, dict[int, int]]) -> None:
+                pass
+
+            def send_buffers(self, buffers: dict[int, bytes | bytearray]) -> None:
+                self.frames.append(dict(buffers))
+                self.sent.set()
+
+            def stop(self) -> None:
+                self.stopped = True
+
+        rig = Rig([Fixture(RGBFixture, 1, 1)])
+        engine = DMXEngine(rig=rig)
+        transport = RecordingTransport()
+        engine._create_transport = lambda: transport  # type: ignore[method-assign]
+        engine.start()
+        try:
+            buffers = engine.render_buffers({rig.all[0]: FixtureDelta(dimmer=(BlendOp.SET, 1.0))})
+            engine.send_buffers(buffers)
+            buffers[1][1] = 0  # Reusing the buffer must not affect the queued frame
+            assert transport.sent.wait(timeout=2.0)
+        finally:
+            engine.stop()
+        assert transport.stopped
+        assert transport.frames[-1][1][1] == 255
+
+
+    def test_send_error_surfaces_without_stopping_worker(self) -> None:
+        import threading
+        import time
+        from dmxld.engine import _SendWorker
+
+        class FlakyTransport:
+            def __init__(self) -> None:
+                self.frames: list[dict[int, bytes]] = []
+                self.sent = threading.Event()
+
+            def send_buffers(self, buffers: dict[int, bytes]) -> None:
+                self.sent.set()
+                if not self.frames:
+                    self.frames.append({})
+                    raise OSError("network unreachable")
+                self.frames.append(buffers)
+
+        transport = FlakyTransport()
+        worker = _SendWorker(transport)  # type: ignore[arg-type]
+        worker.start()
+        try:
+            worker.submit({1: b"a"})
+            deadline = time.monotonic() + 2.0
+            while worker._errors.empty() and time.monotonic() < deadline:
+                time.sleep(0.001)
+            transport.sent.clear()
+            with pytest.raises(OSError):
+                worker.submit({1: b"b"})
+            assert transport.sent.wait(timeout=2.0)
+            assert worker._thread is not None and worker._thread.is_alive()
+            worker.submit({1: b"c"})
+        finally:
+            worker.stop()
+        assert transport.frames[-1] == {1: b"c"}
+
+
+    def test_error_on_last_frame_raised_from_stop(self) -> None:
+        from dmxld.engine import _SendWorker
+
+        class FailingTransport:
+            def send_buffers(self, buffers: dict[int, bytes]) -> None:
+                raise OSError("network unreachable")
+
+        worker = _SendWorker(FailingTransport())  # type: ignore[arg-type]
+        worker.start()
+        worker.submit({1: b"a"})
+        with pytest.raises(OSError):
+            worker.stop()
+
+    def test_send_goes_through_send_thread(self) -> None:
+        import threading
+
+        class RecordingTransport:
+            def __init__(self) -> None:
+                self.frames: list[dict[int, bytes]] = []
+                self.sent = threading.Event()
+                self.threads: set[str] = set()
+
+            def start(self) -> None:
+                pass
+
+            def send(self, universe_data: dict[int, dict[int, int]]) -> None:
+                raise AssertionError("engine must not call send() directly")
+
+            def send_buffers(self, buffers: dict[int, bytes]) -> None:
+                self.threads.add(threading.current_thread().name)
+                self.frames.append(dict(buffers))
+                self.sent.set()
+
+            def stop(self) -> None:
+                pass
+
+        rig = Rig([Fixture(RGBFixture, 1, 1), Fixture(RGBFixture, 2, 1)])
+        engine = DMXEngine(rig=rig)
+        transport = RecordingTransport()
+        engine._create_transport = lambda: transport  # type: ignore[method-assign]
+        engine.start()
+        try:
+            engine.send({1: {1: 255}})
+            assert transport.sent.wait(timeout=2.0)
+        finally:
+            engine.stop()
+        assert transport.threads == {"dmxld-send"}
+        frame = transport.frames[-1]
+        assert frame[1][1] == 255 and len(frame[1]) == 513
+        assert frame[2] == bytes(513)
+
+
+class TestTransportPayload:
+    def test_artnet_payload_is_view_of_snapshot(self) -> None:
+        from dmxld.engine import _ArtNetTransport
+
+        class FakeSender:
+            payload: memoryview | None = None
+
+            def set(self, packet: memoryview) -> None:
+                self.payload = packet
+
+        transport = object.__new__(_ArtNetTransport)
+        sender = FakeSender()
+        transport._senders = {1: sender}  # type: ignore[dict-item]
+        snapshot = bytes([0, 255] + [7] * 511)
+        transport.send_buffers({1: snapshot})
+        assert sender.payload is not None
+        assert sender.payload.obj is snapshot
+        assert len(sender.payload) == 512
+        assert sender.payload[0] == 255
+
+
+    def test_sacn_send_packs_only_set_channels(self) -> None:
+        from dmxld.engine import _SACNTransport
+
+        class FakeOutput:
+            dmx_data: bytearray | None = None
+
+        transport = object.__new__(_SACNTransport)
+        outputs = {1: FakeOutput(), 2: FakeOutput()}
+        transport._sender = outputs
+        transport._universes = [1, 2]
+        transport.send({1: {1: 255, 512: 9, 513: 1}})
+        assert outputs[1].dmx_data == bytearray([255] + [0] * 510 + [9])
+        assert outputs[2].dmx_data == bytearray(512)
+
+
+class TestLazyExports:
+    def test_lazy_names_resolve(self) -> None:
+        import dmxld
+        from dmxld.attributes import DimmerAttr
+        from dmxld.engine import DMXEngine
+
+        assert dmxld.DMXEngine is DMXEngine
+        assert dmxld.DimmerAttr is DimmerAttr
+        assert "DMXEngine" in dir(dmxld)
+
+    def test_unknown_name_raises(self) -> None:
+        import dmxld
+
+        with pytest.raises(AttributeError):
+            getattr(dmxld, "NotAThing")
@@ -2,8 +2,16 @@
 
 import pytest
 
-from dmxld.model import Fixture, FixtureGroup, FixtureState, FixtureType, Rig
-from dmxld.attributes import DimmerAttr, RGBAttr, RGBWAttr
+from dmxld.model import (
+    Fixture,
+    FixtureGroup,
+    FixtureState,
+    FixtureType,
+    Rig,
+    Vec3,
+    color_segment_keys,
+)
+from dmxld.attributes import DimmerAttr, PanAttr, RGBAttr, RGBWAttr, SkipAttr
 from dmxld.color import Raw
 
 
@@ -22,6 +30,12 @@ class TestFixtureState:
         assert "missing" not in state
         assert state.get("missing") is None
 
+    def test_slotted_value_types(self) -> None:
+        """Per-frame value types carry no per-instance __dict__."""
+        assert not hasattr(FixtureState(), "__dict__")
+        assert not hasattr(Vec3(), "__dict__")
+        assert not hasattr(DimmerAttr(), "__dict__")
+
     def test_copy_is_independent(self) -> None:
         state = FixtureState(dimmer=1.0)
         copy = state.copy()
@@ -37,6 +51,13 @@ class TestFixtureType:
         state = FixtureState(dimmer=1.0, color=(1.0, 0.0, 0.0))
         assert RGBDimmer.encode(state) == {0: 255, 1: 255, 2: 0, 3: 0}
 
+    def test_encode_into_matches_encode(self) -> None:
+        state = FixtureState(dimmer=0.5, color=(1.0, 0.5, 0.0))
+        buf = bytearray(8)
+        RGBDimmer.encode_into(state, buf, 2)
+        expected = RGBDimmer.encode(state)
+        assert {i: buf[2 + i] for i in expected} == expected
+
     def test_callable_creates_fixture(self) -> None:
         front = FixtureGroup()
         f = RGBDimmer(universe=1, address=10, groups={front})
@@ -89,6 +110,23 @@ class TestFixtureGroup:
         g = FixtureGroup()
         assert g.group is None
 
+    def test_iterates_in_creation_order(self) -> None:
+        g = FixtureGroup()
+        other = FixtureGroup()
+        fixtures = [
+            Fixture(DimmerOnly, 1, i + 1, groups={g, other} if i % 2 else {g})
+            for i in range(64)
+        ]
+        assert list(g) == fixtures
+        assert list(g - other) == fixtures[::2]
+
+    def test_creation_order_is_not_a_field(self) -> None:
+        import dataclasses
+
+        f = Fixture(DimmerOnly, 1, 1)
+        assert "_order" not in {fld.name for fld in dataclasses.fields(f)}
+        assert "_order" not in dataclasses.asdict(f)
+
     def test_collects_fixtures(self) -> None:
         front = FixtureGroup()
         f1 = Fixture(DimmerOnly, 1, 1, groups={front})
@@ -111,6 +149,14 @@ class TestFixtureGroup:
         f = Fixture(DimmerOnly, 1, 1, groups={front})
         assert f in front(None)
 
+    def test_call_returns_shared_snapshot(self) -> None:
+        front = FixtureGroup()
+        f1 = Fixture(DimmerOnly, 1, 1, groups={front})
+        assert front(None) is front(None)
+        assert front(None) == (f1,)
+        f2 = Fixture(DimmerOnly, 1, 2, groups={front})
+        assert set(front(None)) == {f1, f2}
+
     def test_union_and_intersection(self) -> None:
         front = FixtureGroup()
         back = FixtureGroup()
@@ -207,6 +253,164 @@ class TestRig:
         assert dmx[1][10] == 255
         assert dmx[1][20] == 255
 
+    def test_encode_into_buffers_matches_encode_to_dmx(self) -> None:
+        rig = Rig([Fixture(DimmerOnly, 1, 1), Fixture(DimmerOnly, 2, 512)])
+        states = {f: FixtureState(dimmer=0.5) for f in rig.all}
+        buffers = rig.encode_into_buffers(states, {})
+        expected = rig.encode_to_dmx(states)
+        for u, channels in expected.items():
+            assert len(buffers[u]) == 513
+            assert {ch: buffers[u][ch] for ch in channels} == channels
+
+    def test_encode_to_dmx_drops_channels_past_512(self) -> None:
+        inside = Fixture(RGBDimmer, 1, 1)
+        edge = Fixture(RGBDimmer, 1, 511)
+        rig = Rig([inside, edge])
+        states = {f: FixtureState(dimmer=1.0, color=(0.0, 1.0, 0.0)) for f in rig.all}
+        dmx = rig.encode_to_dmx(states)
+        assert dmx[1] == {1: 255, 2: 0, 3: 255, 4: 0, 511: 255, 512: 0}
+
+    def test_encode_to_dmx_follows_address_change(self) -> None:
+        fixture = Fixture(RGBDimmer, 1, 1)
+        rig = Rig([fixture])
+        fixture.address = 100
+
+        dmx = rig.encode_to_dmx({fixture: FixtureState(dimmer=1.0)})
+        assert dmx[1] == {100: 255, 101: 0, 102: 0, 103: 0}
+
+    def test_encode_into_buffers_follows_universe_change(self) -> None:
+        fixture = Fixture(RGBDimmer, 1, 1)
+        rig = Rig([fixture])
+        version = rig.version
+        fixture.universe = 2
+        assert rig.version > version
+
+        buffers = rig.encode_into_buffers({fixture: FixtureState(dimmer=1.0)}, {})
+        assert buffers[2][1] == 255
+        assert not any(buffers.get(1, b""))
+
+    def test_encode_into_buffers_reuses_and_clears(self) -> None:
+        f = Fixture(DimmerOnly, 1, 1)
+        rig = Rig([f])
+        buf = bytearray(513)
+        buf[100] = 9
+        buffers = {1: buf}
+        rig.encode_into_buffers({f: FixtureState(dimmer=1.0)}, buffers)
+        assert buffers[1] is buf
+        assert buf[1] == 255
+        assert buf[100] == 0
+
+    def test_encode_into_buffers_handles_fixtures_outside_plan(self) -> None:
+        member = Fixture(RGBDimmer, 1, 1)
+        stranger = Fixture(DimmerOnly, 3, 5)
+        rig = Rig([member])
+        states = {
+            member: FixtureState(dimmer=1.0, color=(1.0, 0.0, 0.0)),
+            stranger: FixtureState(dimmer=1.0),
+        }
+        buffers = rig.encode_into_buffers(states, {})
+        assert bytes(buffers[1][1:5]) == bytes([255, 255, 0, 0])
+        assert buffers[3][5] == 255
+
+    def test_len_and_insertion_order(self) -> None:
+        f1 = Fixture(DimmerOnly, 1, 1)
+        f2 = Fixture(DimmerOnly, 1, 2)
+        rig = Rig([f1])
+        rig.add(f2)
+        assert len(rig) == 2
+        assert rig.all == [f1, f2]
+
+    def test_select_filters_and_caches(self) -> None:
+        left = Fixture(DimmerOnly, 1, 1, pos=Vec3(x=-1.0))
+        right = Fixture(DimmerOnly, 1, 2, pos=Vec3(x=1.0))
+        rig = Rig([left, right])
+        calls = []
+
+        def is_left(f: Fixture) -> bool:
+            calls.append(f)
+            return f.pos.x < 0
+
+        assert rig.select(is_left) == (left,)
+        assert rig.select(is_left) is rig.select(is_left)
+        assert len(calls) == 2
+
+    def test_select_cache_invalidated_on_add(self) -> None:
+        rig = Rig([Fixture(DimmerOnly, 1, 1, pos=Vec3(x=-1.0))])
+        is_left = lambda f: f.pos.x < 0
+        assert len(rig.select(is_left)) == 1
+        rig.add(Fixture(DimmerOnly, 1, 2, pos=Vec3(x=-2.0)))
+        assert len(rig.select(is_left)) == 2
+
+    def test_select_cache_drops_discarded_predicates(self) -> None:
+        import gc
+
+        rig = Rig([Fixture(DimmerOnly, 1, 1, pos=Vec3(x=-1.0))])
+        for _ in range(20):
+            assert len(rig.select(lambda f: f.pos.x < 0)) == 1
+        gc.collect()
+        assert len(rig._select_cache) == 0
+
+
+class TestFixtureEncodeInto:
+    def test_writes_at_address(self) -> None:
+        f = Fixture(RGBDimmer, universe=1, address=10)
+        buf = bytearray(513)
+        f.encode_into(FixtureState(dimmer=1.0, color=(0.0, 1.0, 0.0)), buf)
+        assert list(buf[10:14]) == [255, 0, 255, 0]
+        assert len(buf) == 513
+
+    def test_drops_channels_past_512(self) -> None:
+        f = Fixture(RGBDimmer, universe=1, address=511)
+        buf = bytearray(513)
+        f.encode_into(FixtureState(dimmer=1.0, color=(1.0, 1.0, 1.0)), buf)
+        assert buf[511] == 255
+        assert buf[512] == 255
+        assert len(buf) == 513
+
+
+class TestSpecializedEncoder:
+    def test_builtin_layout_is_specialized(self) -> None:
+        assert RGBDimmer.compiled_encoder is not None
+        assert FixtureType(RGBAttr(segments=2)).compiled_encoder is not None
+
+    def test_custom_attribute_falls_back(self) -> None:
+        class CustomAttr:
+            name = "custom"
+            channel_count = 1
+            default_value = 0.0
+
+            def encode(self, value: float) -> list[int]:
+                return [7]
+
+        assert FixtureType(DimmerAttr(), CustomAttr()).compiled_encoder is None
+
+    @pytest.mark.parametrize("state", [
+        FixtureState(),
+        FixtureState(dimmer=0.5, color=(1.0, 1.0, 0.5), pan=0.3),
+        FixtureState(dimmer=1.5, color=Raw(0.1, 0.2, 0.3, 0.4), pan=-1.0),
+    ])
+    def test_matches_generic_encode(self, state) -> None:
+        ft = FixtureType(DimmerAttr(), RGBWAttr(), SkipAttr(count=2), PanAttr(fine=True))
+        buf = bytearray(b"\xff" * 12)
+        ft.encode_into(state, buf, 1)
+        expected = ft._encode_generic(state)
+        assert {i: buf[1 + i] for i in expected} == expected
+        assert ft.encode(state) == expected
+
+    @pytest.mark.parametrize("state", [
+        FixtureState(),
+        FixtureState(color=(1.0, 0.5, 0.0)),
+        FixtureState(color=(1.0, 0.5, 0.0), color_1=(0.0, 0.0, 1.0)),
+        FixtureState(color_0=Raw(0.1, 0.2, 0.3, 0.4), color_2=(1.0, 1.0, 1.0)),
+    ])
+    def test_segmented_matches_generic_encode(self, state) -> None:
+        ft = FixtureType(DimmerAttr(), RGBWAttr(segments=3))
+        buf = bytearray(b"\xff" * 16)
+        ft.encode_into(state, buf, 2)
+        expected = ft._encode_generic(state)
+        assert {i: buf[2 + i] for i in expected} == expected
+        assert ft.encode(state) == expected
+
 
 class TestRigOverlapDetection:
     def test_overlapping_raises(self) -> None:
@@ -228,6 +432,16 @@ class TestRigOverlapDetection:
         ])
         assert len(rig.all) == 2
 
+    def test_overlap_with_earlier_non_adjacent_fixture_raises(self) -> None:
+        rig = Rig([Fixture(RGBDimmer, 1, 100), Fixture(RGBDimmer, 1, 1)])
+        rig.add(Fixture(RGBDimmer, 1, 50))
+        with pytest.raises(ValueError, match="address 100"):
+            rig.add(Fixture(RGBDimmer, 1, 98))
+        with pytest.raises(ValueError, match="address 100"):
+            rig.add(Fixture(DimmerOnly, 1, 103))
+        rig.add(Fixture(RGBDimmer, 1, 104))
+        assert len(rig) == 4
+
     def test_same_address_different_universe_ok(self) -> None:
         rig = Rig([
             Fixture(RGBDimmer, 1, 1),
@@ -235,11 +449,22 @@ class TestRigOverlapDetection:
         ])
         assert len(rig.all) == 2
 
+    def test_repatch_into_occupied_channels_raises(self) -> None:
+        moved = Fixture(RGBDimmer, 1, 1)
+        rig = Rig([moved, Fixture(RGBDimmer, 1, 5)])
+        with pytest.raises(ValueError, match="address 5"):
+            moved.address = 3
+        assert moved.address == 1
+        moved.address = 9
+        rig.add(Fixture(RGBDimmer, 1, 1))
+        assert len(rig) == 3
+
 
 class TestSegmentedFixtures:
     def test_segment_count(self) -> None:
         LEDBar = FixtureType(DimmerAttr(), RGBWAttr(segments=4))
         assert LEDBar.channel_count == 17
+        assert LEDBar.segment_count == 4
 
         fixture = Fixture(LEDBar, universe=1, address=1)
         assert fixture.segment_count == 4
@@ -286,6 +511,17 @@ class TestSegmentedFixtures:
         assert encoded[6] == 127  # G seg1
 
 
+class TestColorSegmentKeys:
+    def test_keys_are_shared(self) -> None:
+        keys = color_segment_keys(3)
+        assert keys == ("color_0", "color_1", "color_2")
+        assert color_segment_keys(3) is keys
+
+    def test_fixture_type_exposes_keys(self) -> None:
+        assert FixtureType(RGBAttr(segments=3)).color_keys is color_segment_keys(3)
+        assert RGBDimmer.color_keys == ("color_0",)
+
+
 class TestResolveColorValue:
     def test_dict_color_returns_default(self) -> None:
         """Dict color value (e.g. unresolved $var ref) returns default, not KeyError."""